@@ -0,0 +1,55 @@
+"""
+Time-based response cache for polled, read-only endpoints.
+
+Monitoring and task listings are often polled by UIs and agents. Callers can
+opt in to reusing a recent response by passing a TTL; entries are stamped
+when the upstream call completes, so the TTL measures the age of the data.
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Bounded cache of responses keyed by request, each with its fetch time."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, ttl: float) -> Optional[Any]:
+        """
+        Return the cached value for key if it is younger than ttl seconds.
+
+        Args:
+            key: Cache key for the request
+            ttl: Maximum age in seconds; values <= 0 always miss
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        if ttl <= 0:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        fetched_at, value = entry
+        if time.monotonic() - fetched_at >= ttl:
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value for key, evicting the oldest entry when full."""
+        entries = self._entries
+        # Re-insert so iteration order stays oldest-fetched first
+        entries.pop(key, None)
+        if len(entries) >= self.max_entries:
+            entries.pop(next(iter(entries)))
+        entries[key] = (time.monotonic(), value)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
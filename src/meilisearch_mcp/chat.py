@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlencode
 import httpx
+import orjson
 import json
 
 from .logging import MCPLogger
@@ -15,6 +16,7 @@ class ChatManager:
         self.headers = {"Content-Type": "application/json"}
         if api_key and api_key.strip():
             self.headers["Authorization"] = f"Bearer {api_key.strip()}"
+        self._has_auth = "Authorization" in self.headers
 
     async def create_chat_completion(
         self,
@@ -36,7 +38,7 @@ class ChatManager:
                 "stream": stream,
             }
 
-            has_auth = "Authorization" in self.headers
+            has_auth = self._has_auth
             logger.debug(
                 "Creating chat completion request",
                 url=request_url,
@@ -113,7 +115,7 @@ class ChatManager:
             if params:
                 request_url += f"?{urlencode(params)}"
 
-            has_auth = "Authorization" in self.headers
+            has_auth = self._has_auth
             logger.debug(
                 "Getting chat workspaces",
                 url=request_url,
@@ -129,7 +131,7 @@ class ChatManager:
                         has_auth_header=has_auth,
                     )
                 response.raise_for_status()
-                workspaces = response.json()
+                workspaces = orjson.loads(response.content)
                 logger.info(
                     f"Retrieved {len(workspaces.get('results', []))} chat workspaces"
                 )
@@ -151,7 +153,7 @@ class ChatManager:
             endpoint = f"/chats/{workspace_uid}/settings"
             request_url = f"{self.url}{endpoint}"
 
-            has_auth = "Authorization" in self.headers
+            has_auth = self._has_auth
             logger.debug(
                 "Getting chat workspace settings",
                 url=request_url,
@@ -169,7 +171,7 @@ class ChatManager:
                         has_auth_header=has_auth,
                     )
                 response.raise_for_status()
-                settings = response.json()
+                settings = orjson.loads(response.content)
                 logger.info(f"Retrieved settings for workspace: {workspace_uid}")
                 return settings
         except httpx.HTTPStatusError as e:
@@ -189,7 +191,7 @@ class ChatManager:
             endpoint = f"/chats/{workspace_uid}/settings"
             request_url = f"{self.url}{endpoint}"
 
-            has_auth = "Authorization" in self.headers
+            has_auth = self._has_auth
             logger.debug(
                 "Updating chat workspace settings",
                 url=request_url,
@@ -211,7 +213,7 @@ class ChatManager:
                         has_auth_header=has_auth,
                     )
                 response.raise_for_status()
-                updated_settings = response.json()
+                updated_settings = orjson.loads(response.content)
                 logger.info(f"Updated settings for workspace: {workspace_uid}")
                 return updated_settings
         except httpx.HTTPStatusError as e:
@@ -234,7 +236,7 @@ class ChatManager:
                     method="DELETE", url=request_url, headers=self.headers, timeout=30.0
                 )
                 response.raise_for_status()
-                settings = response.json()
+                settings = orjson.loads(response.content)
                 logger.info(f"Reset settings for workspace: {workspace_uid}")
                 return settings
         except httpx.HTTPStatusError as e:
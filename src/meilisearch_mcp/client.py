@@ -1,4 +1,5 @@
 import httpx
+import orjson
 from typing import Optional, Dict, Any, List
 
 from .indexes import IndexManager
@@ -8,6 +9,7 @@ from .settings import SettingsManager
 from .keys import KeyManager
 from .logging import MCPLogger
 from .monitoring import MonitoringManager
+from .cache import TTLCache
 from .http_client import get_http_pool
 from .config import config
 
@@ -19,18 +21,48 @@ class MeilisearchClient:
         self, url: str = "http://localhost:7700", api_key: Optional[str] = None
     ):
         """Initialize Meilisearch client"""
-        self.url = url.rstrip("/")
-        self.api_key = api_key
         self.indexes = IndexManager(url, api_key)
         self.documents = DocumentManager(url, api_key)
         self.settings = SettingsManager(url, api_key)
         self.tasks = TaskManager(url, api_key)
         self.keys = KeyManager(url, api_key)
         self.monitoring = MonitoringManager(url, api_key)
+        # Opt-in cache for polled version/stats requests
+        self._cache = TTLCache()
+        self.configure(url, api_key)
+
+    def configure(self, url: str, api_key: Optional[str] = None) -> None:
+        """
+        Point the client and its managers at url with api_key.
+
+        Used on construction and to apply connection updates in place: the
+        managers are kept and updated, and responses cached under the previous
+        settings are dropped. HTTP connections are pooled per URL and are not
+        affected.
+        """
+        self.url = url.rstrip("/")
+        self.api_key = api_key
         # Store headers for HTTP requests
         self.headers = {"Content-Type": "application/json"}
         if api_key and api_key.strip():
             self.headers["Authorization"] = f"Bearer {api_key.strip()}"
+        has_auth = "Authorization" in self.headers
+        for manager in (
+            self.indexes,
+            self.documents,
+            self.settings,
+            self.tasks,
+            self.keys,
+            self.monitoring,
+        ):
+            manager.url = self.url
+            manager.api_key = api_key
+            manager.headers = dict(self.headers)
+            manager._has_auth = has_auth
+        self.tasks._cache.clear()
+        self.monitoring._cache.clear()
+        self._cache.clear()
+        if has_auth:
             logger.debug(
                 f"MeilisearchClient initialized with auth",
                 url=self.url,
@@ -54,13 +86,21 @@ class MeilisearchClient:
             )
             response = client.get("/health", headers=headers)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get("status") == "available"
         except Exception:
             return False
 
-    def get_version(self) -> Dict[str, Any]:
-        """Get Meilisearch version information using GET /version"""
+    def get_version(self, ttl: float = 0) -> Dict[str, Any]:
+        """
+        Get Meilisearch version information using GET /version
+
+        A positive ttl (in seconds) returns a cached response if it was
+        fetched less than ttl seconds ago.
+        """
+        cached = self._cache.get("/version", ttl)
+        if cached is not None:
+            return cached
         try:
             http_pool = get_http_pool()
             client, headers = http_pool.get_client(
@@ -80,7 +120,10 @@ class MeilisearchClient:
                 has_auth_header="Authorization" in headers,
             )
             response.raise_for_status()
-            return response.json()
+            version = orjson.loads(response.content)
+            if ttl > 0:
+                self._cache.set("/version", version)
+            return version
         except httpx.HTTPStatusError as e:
             logger.error(
                 "Failed to get version - HTTP error",
@@ -92,8 +135,16 @@ class MeilisearchClient:
             logger.error("Failed to get version - exception", error=str(e))
             raise Exception(f"Failed to get version: {str(e)}")
 
-    def get_stats(self) -> Dict[str, Any]:
-        """Get database stats using GET /stats"""
+    def get_stats(self, ttl: float = 0) -> Dict[str, Any]:
+        """
+        Get database stats using GET /stats
+
+        A positive ttl (in seconds) returns a cached response if it was
+        fetched less than ttl seconds ago.
+        """
+        cached = self._cache.get("/stats", ttl)
+        if cached is not None:
+            return cached
         try:
             http_pool = get_http_pool()
             client, headers = http_pool.get_client(
@@ -103,7 +154,10 @@ class MeilisearchClient:
             )
             response = client.get("/stats", headers=headers)
             response.raise_for_status()
-            return response.json()
+            stats = orjson.loads(response.content)
+            if ttl > 0:
+                self._cache.set("/stats", stats)
+            return stats
         except httpx.HTTPStatusError as e:
             raise Exception(f"Failed to get stats: {e.response.text}")
         except Exception as e:
@@ -152,11 +206,14 @@ class MeilisearchClient:
                 endpoint = f"/indexes/{index_uid}/search"
                 response = client.post(endpoint, json=search_body, headers=headers)
                 response.raise_for_status()
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 # Search across all indices
                 results = {}
-                indexes = self.indexes.list_indexes()
+                # Listed on the sync client: search runs in sync code
+                indexes_response = client.get("/indexes", headers=headers)
+                indexes_response.raise_for_status()
+                indexes = orjson.loads(indexes_response.content)
 
                 for index_data in indexes["results"]:
                     try:
@@ -164,7 +221,7 @@ class MeilisearchClient:
                         endpoint = f"/indexes/{index_uid}/search"
                         search_response = client.post(endpoint, json=search_body, headers=headers)
                         search_response.raise_for_status()
-                        search_result = search_response.json()
+                        search_result = orjson.loads(search_response.content)
                         if search_result.get(
                             "hits"
                         ):  # Only include indices with matches
@@ -187,7 +244,31 @@ class MeilisearchClient:
         except Exception as e:
             raise Exception(f"Search failed: {str(e)}")
 
-    def get_indexes(self) -> Dict[str, Any]:
+    def multi_search(self, queries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run several searches in one request using POST /multi-search
+
+        Each query carries its own indexUid along with the usual search
+        parameters (q, limit, offset, filter, sort, ...).
+        """
+        try:
+            http_pool = get_http_pool()
+            client, headers = http_pool.get_client(
+                self.url,
+                self.api_key,
+                timeout=config.HTTP_TIMEOUT,
+            )
+            response = client.post(
+                "/multi-search", json={"queries": queries}, headers=headers
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            raise Exception(f"Multi-search failed: {e.response.text}")
+        except Exception as e:
+            raise Exception(f"Multi-search failed: {str(e)}")
+
+    async def get_indexes(self) -> Dict[str, Any]:
         """Get all indexes"""
         # list_indexes already returns the correct format from the API
-        return self.indexes.list_indexes()
+        return await self.indexes.list_indexes()
@@ -6,9 +6,94 @@ and validation for production deployments.
 """
 
 import os
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Mapping, Optional, List
 from urllib.parse import urlparse
-from .security import validate_url
+
+# CORS headers that do not depend on the request, frozen at import time.
+# The wildcard set is returned as is; the origin-specific set is merged
+# behind the request's Access-Control-Allow-Origin.
+_WILDCARD_CORS = MappingProxyType(
+    {
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+        "Access-Control-Allow-Headers": "*",
+        "Access-Control-Max-Age": "86400",
+    }
+)
+_STATIC_CORS = MappingProxyType(
+    {
+        "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+        "Access-Control-Allow-Headers": "Content-Type, Authorization, X-MCP-Token",
+        "Access-Control-Expose-Headers": "Content-Type",
+        "Access-Control-Max-Age": "86400",
+    }
+)
+
+_ALLOWED_SCHEMES = ("http://", "https://")
+
+
+def _is_valid_origin(origin: str) -> bool:
+    """Check that origin is a bare http(s) scheme and host, as browsers send it."""
+    for scheme in _ALLOWED_SCHEMES:
+        if origin.startswith(scheme):
+            rest = origin[len(scheme) :]
+            return bool(rest) and "/" not in rest and " " not in rest
+    return False
+
+
+# (setting, minimum, maximum or None, message if too low, message if too high)
+_NUMERIC_LIMITS = (
+    (
+        "MAX_REQUEST_SIZE",
+        1024,  # At least 1KB
+        1024 * 1024 * 1024,  # Max 1GB
+        "MAX_REQUEST_SIZE must be at least 1024 bytes",
+        "MAX_REQUEST_SIZE exceeds safe limit of 1GB",
+    ),
+    (
+        "REQUEST_TIMEOUT",
+        1.0,
+        3600.0,  # Max 1 hour
+        "REQUEST_TIMEOUT must be at least 1.0 seconds",
+        "REQUEST_TIMEOUT exceeds safe limit of 1 hour",
+    ),
+    (
+        "HTTP_MAX_CONNECTIONS",
+        1,
+        10000,  # Reasonable upper limit
+        "HTTP_MAX_CONNECTIONS must be at least 1",
+        "HTTP_MAX_CONNECTIONS exceeds safe limit of 10000",
+    ),
+    (
+        "HTTP_MAX_KEEPALIVE",
+        1,
+        None,  # Bounded by HTTP_MAX_CONNECTIONS instead
+        "HTTP_MAX_KEEPALIVE must be at least 1",
+        None,
+    ),
+    (
+        "HTTP_TIMEOUT",
+        0.1,
+        600.0,  # Max 10 minutes
+        "HTTP_TIMEOUT must be at least 0.1 seconds",
+        "HTTP_TIMEOUT exceeds safe limit of 10 minutes",
+    ),
+    (
+        "HTTP_KEEPALIVE_EXPIRY",
+        0,
+        None,
+        "HTTP_KEEPALIVE_EXPIRY cannot be negative",
+        None,
+    ),
+    (
+        "HEALTH_CHECK_TIMEOUT",
+        0.1,
+        30.0,  # Max 30 seconds
+        "HEALTH_CHECK_TIMEOUT must be at least 0.1 seconds",
+        "HEALTH_CHECK_TIMEOUT exceeds safe limit of 30 seconds",
+    ),
+)
 
 
 class Config:
@@ -37,6 +122,11 @@ class Config:
         else ["*"]
     )
 
+    # Allowed origins as a set, rebuilt when CORS_ORIGINS is reassigned
+    _cors_origins_source: Optional[List[str]] = None
+    _cors_origins_set: frozenset = frozenset()
+    _cors_wildcard: bool = False
+
     # Request limits
     MAX_REQUEST_SIZE: int = int(
         os.getenv("MAX_REQUEST_SIZE", "10485760")
@@ -47,6 +137,10 @@ class Config:
     HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
     HTTP_MAX_KEEPALIVE: int = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
     HTTP_TIMEOUT: float = float(os.getenv("HTTP_TIMEOUT", "30.0"))
+    # Seconds an idle pooled connection is kept open between polls
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "300.0"))
+    # Multiplex concurrent requests over one HTTP/2 connection when possible
+    HTTP_HTTP2: bool = os.getenv("HTTP_HTTP2", "true").lower() != "false"
 
     # Logging
     LOG_DIR: Optional[str] = os.getenv(
@@ -88,40 +182,22 @@ class Config:
                     errors.append(f"Invalid CORS origin format: {origin}")
 
         # Validate numeric settings (both minimum and maximum values)
-        if cls.MAX_REQUEST_SIZE < 1024:  # At least 1KB
-            errors.append("MAX_REQUEST_SIZE must be at least 1024 bytes")
-        if cls.MAX_REQUEST_SIZE > 1024 * 1024 * 1024:  # Max 1GB
-            errors.append("MAX_REQUEST_SIZE exceeds safe limit of 1GB")
-
-        if cls.REQUEST_TIMEOUT < 1.0:
-            errors.append("REQUEST_TIMEOUT must be at least 1.0 seconds")
-        if cls.REQUEST_TIMEOUT > 3600.0:  # Max 1 hour
-            errors.append("REQUEST_TIMEOUT exceeds safe limit of 1 hour")
-
-        if cls.HTTP_MAX_CONNECTIONS < 1:
-            errors.append("HTTP_MAX_CONNECTIONS must be at least 1")
-        if cls.HTTP_MAX_CONNECTIONS > 10000:  # Reasonable upper limit
-            errors.append("HTTP_MAX_CONNECTIONS exceeds safe limit of 10000")
-
-        if cls.HTTP_MAX_KEEPALIVE < 1:
-            errors.append("HTTP_MAX_KEEPALIVE must be at least 1")
+        for name, minimum, maximum, too_low, too_high in _NUMERIC_LIMITS:
+            value = getattr(cls, name)
+            if value < minimum:
+                errors.append(too_low)
+            elif maximum is not None and value > maximum:
+                errors.append(too_high)
+
         if cls.HTTP_MAX_KEEPALIVE > cls.HTTP_MAX_CONNECTIONS:
             errors.append("HTTP_MAX_KEEPALIVE cannot exceed HTTP_MAX_CONNECTIONS")
 
-        if cls.HTTP_TIMEOUT < 0.1:
-            errors.append("HTTP_TIMEOUT must be at least 0.1 seconds")
-        if cls.HTTP_TIMEOUT > 600.0:  # Max 10 minutes
-            errors.append("HTTP_TIMEOUT exceeds safe limit of 10 minutes")
-
-        if cls.HEALTH_CHECK_TIMEOUT < 0.1:
-            errors.append("HEALTH_CHECK_TIMEOUT must be at least 0.1 seconds")
-        if cls.HEALTH_CHECK_TIMEOUT > 30.0:  # Max 30 seconds
-            errors.append("HEALTH_CHECK_TIMEOUT exceeds safe limit of 30 seconds")
-
         return errors
 
     @classmethod
-    def get_cors_headers(cls, request_origin: Optional[str] = None) -> dict:
+    def get_cors_headers(
+        cls, request_origin: Optional[str] = None
+    ) -> Mapping[str, str]:
         """
         Get CORS headers based on configuration and request origin.
 
@@ -129,29 +205,33 @@ class Config:
             request_origin: The Origin header from the incoming request
 
         Returns:
-            Dictionary of CORS headers, or empty dict if origin not allowed
+            Mapping of CORS headers (shared and read-only for wildcard CORS),
+            or empty dict if origin not allowed
         """
-        if "*" in cls.CORS_ORIGINS:
+        cls._refresh_cors_origins()
+        if cls._cors_wildcard:
             # Allow all origins
-            return {
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-                "Access-Control-Allow-Headers": "*",
-                "Access-Control-Max-Age": "86400",
-            }
-        elif request_origin and validate_url(request_origin) and request_origin in cls.CORS_ORIGINS:
-            # Validate origin URL format and check if it matches allowed origins
-            return {
-                "Access-Control-Allow-Origin": request_origin,
-                "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-                "Access-Control-Allow-Headers": "Content-Type, Authorization, X-MCP-Token",
-                "Access-Control-Expose-Headers": "Content-Type",
-                "Access-Control-Max-Age": "86400",
-            }
+            return _WILDCARD_CORS
+        elif request_origin in cls._cors_origins_set:
+            # Only well-formed configured origins are in the set, so a match
+            # needs no further URL validation
+            return {"Access-Control-Allow-Origin": request_origin, **_STATIC_CORS}
         else:
             # Origin not allowed or invalid, return empty headers
             return {}
 
+    @classmethod
+    def _refresh_cors_origins(cls) -> None:
+        """Rebuild the allowed-origin set if CORS_ORIGINS was replaced."""
+        origins = cls.CORS_ORIGINS
+        if cls._cors_origins_source is origins:
+            return
+        cls._cors_wildcard = "*" in origins
+        cls._cors_origins_set = frozenset(
+            origin for origin in origins if _is_valid_origin(origin)
+        )
+        cls._cors_origins_source = origins
+
 
 # Global config instance
 config = Config()
@@ -7,15 +7,24 @@ including the Meilisearch client and chat manager instances.
 
 import os
 import threading
-from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional
+from urllib.parse import urlsplit
 
 from .client import MeilisearchClient
 from .chat import ChatManager
 from .logging import MCPLogger
 
 
-@dataclass
+def _origin(url: str) -> tuple:
+    """Scheme and host:port of url, used to tell whether the server changed."""
+    parts = urlsplit(url)
+    return parts.scheme, parts.netloc
+
+
+_UNSET = object()
+
+
 class ServerContext:
     """
     Server context holding shared state for all MCP tools.
@@ -24,41 +33,61 @@ class ServerContext:
     allowing tools to access the Meilisearch client and other shared resources.
     """
 
-    url: str = field(
-        default_factory=lambda: os.getenv("MEILI_HTTP_ADDR", "http://localhost:7700")
-    )
-    api_key: Optional[str] = field(
-        default_factory=lambda: os.getenv("MEILI_MASTER_KEY")
-    )
-    log_dir: Optional[str] = field(
-        default_factory=lambda: os.path.expanduser("~/.meilisearch-mcp/logs")
-    )
-
-    # Lazy-initialized clients
-    _meili_client: Optional[MeilisearchClient] = field(default=None, repr=False)
-    _chat_manager: Optional[ChatManager] = field(default=None, repr=False)
-    _logger: Optional[MCPLogger] = field(default=None, repr=False)
-
-    @property
+    # Connection settings live in slots; __dict__ is kept for the
+    # cached_property clients below.
+    __slots__ = ("url", "api_key", "log_dir", "connection_summary", "__dict__")
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = _UNSET,
+        log_dir: Optional[str] = _UNSET,
+    ):
+        self.url: str = (
+            url
+            if url is not None
+            else os.getenv("MEILI_HTTP_ADDR", "http://localhost:7700")
+        )
+        self.api_key: Optional[str] = (
+            api_key if api_key is not _UNSET else os.getenv("MEILI_MASTER_KEY")
+        )
+        self.log_dir: Optional[str] = (
+            log_dir
+            if log_dir is not _UNSET
+            else os.path.expanduser("~/.meilisearch-mcp/logs")
+        )
+        # Formatted settings for get-connection-settings, rebuilt on update
+        self.connection_summary: str = ""
+        self._refresh_connection_summary()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(url={self.url!r}, api_key={self.api_key!r}, "
+            f"log_dir={self.log_dir!r})"
+        )
+
+    def _refresh_connection_summary(self) -> None:
+        api_key_display = "*" * 8 if self.api_key else "Not set"
+        self.connection_summary = (
+            f"Current connection settings:\nURL: {self.url}\nAPI Key: {api_key_display}"
+        )
+
+    # Lazy-initialized clients: cached_property stores each one in the
+    # instance __dict__ on first access, so later reads skip the descriptor.
+    @cached_property
     def meili_client(self) -> MeilisearchClient:
         """Get or create the Meilisearch client."""
-        if self._meili_client is None:
-            self._meili_client = MeilisearchClient(self.url, self.api_key)
-        return self._meili_client
+        return MeilisearchClient(self.url, self.api_key)
 
-    @property
+    @cached_property
     def chat_manager(self) -> ChatManager:
         """Get or create the chat manager."""
-        if self._chat_manager is None:
-            self._chat_manager = ChatManager(self.url, self.api_key)
-        return self._chat_manager
+        return ChatManager(self.url, self.api_key)
 
-    @property
+    @cached_property
     def logger(self) -> MCPLogger:
         """Get or create the logger."""
-        if self._logger is None:
-            self._logger = MCPLogger("meilisearch-mcp", self.log_dir)
-        return self._logger
+        return MCPLogger("meilisearch-mcp", self.log_dir)
 
     def update_connection(
         self, url: Optional[str] = None, api_key: Optional[str] = None
@@ -70,14 +99,21 @@ class ServerContext:
             url: New Meilisearch URL (optional)
             api_key: New API key (optional, can be empty string to clear)
         """
+        previous_origin = _origin(self.url)
         if url:
             self.url = url
         if api_key is not None:
             self.api_key = api_key.strip() if api_key and api_key.strip() else None
+        self._refresh_connection_summary()
 
-        # Reinitialize clients with new settings
-        self._meili_client = MeilisearchClient(self.url, self.api_key)
-        self._chat_manager = ChatManager(self.url, self.api_key)
+        # Reconfigure the existing client in place unless the server changed;
+        # otherwise drop it so the next access builds one for the new settings
+        meili_client = self.__dict__.get("meili_client")
+        if meili_client is not None and _origin(self.url) == previous_origin:
+            meili_client.configure(self.url, self.api_key)
+        else:
+            self.__dict__.pop("meili_client", None)
+        self.__dict__.pop("chat_manager", None)
 
         self.logger.info(
             "Updated Meilisearch connection settings",
@@ -88,12 +124,17 @@ class ServerContext:
 
     def cleanup(self) -> None:
         """Clean shutdown of resources."""
-        if self._logger:
-            self._logger.info("Shutting down MCP server")
-            self._logger.shutdown()
+        logger = self.__dict__.get("logger")
+        if logger:
+            logger.info("Shutting down MCP server")
+            logger.shutdown()
 
 
-# Global context instance - initialized lazily with thread safety
+# Global context instance - initialized lazily with thread safety.
+# This is deliberately a module global rather than a ContextVar: the server
+# installs the context once before the event loop starts, and a context
+# created or replaced from inside one task or worker thread must be visible
+# to every other tool call. Reads on the fast path take no lock.
 _context: Optional[ServerContext] = None
 _context_lock = threading.Lock()
 
@@ -102,16 +143,18 @@ def get_context() -> ServerContext:
     """
     Get the global server context, creating it if necessary.
 
-    Uses double-checked locking pattern for thread-safe lazy initialization.
+    Uses double-checked locking pattern for thread-safe lazy initialization;
+    once the context exists this is a single global read with no locking.
     """
     global _context
-    if _context is None:
-        with _context_lock:
-            # Double-check after acquiring lock
-            if _context is None:
-                _context = ServerContext()
-            return _context
-    return _context
+    ctx = _context
+    if ctx is not None:
+        return ctx
+    with _context_lock:
+        # Double-check after acquiring lock
+        if _context is None:
+            _context = ServerContext()
+        return _context
 
 
 def set_context(context: ServerContext) -> None:
@@ -1,6 +1,7 @@
 from typing import Dict, Any, List, Optional, Union
 from urllib.parse import urlencode
 import httpx
+import orjson
 
 from .logging import MCPLogger
 from .http_client import get_http_pool
@@ -19,7 +20,7 @@ class DocumentManager:
         if api_key and api_key.strip():
             self.headers["Authorization"] = f"Bearer {api_key.strip()}"
 
-    def _make_request(
+    async def _make_request(
         self,
         method: str,
         endpoint: str,
@@ -34,12 +35,14 @@ class DocumentManager:
             has_auth_header=has_auth,
         )
         http_pool = get_http_pool()
-        client, headers = http_pool.get_client(
+        client, headers = http_pool.get_async_client(
             self.url,
             self.api_key,
             timeout=config.HTTP_TIMEOUT,
         )
-        response = client.request(method=method, url=endpoint, headers=headers, json=json)
+        response = await client.request(
+            method=method, url=endpoint, headers=headers, json=json
+        )
         if response.status_code == 401:
             logger.error(
                 "Authentication failed",
@@ -48,9 +51,9 @@ class DocumentManager:
                 response_text=response.text[:200],
             )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
-    def get_documents(
+    async def get_documents(
         self,
         index_uid: str,
         offset: Optional[int] = None,
@@ -68,25 +71,25 @@ class DocumentManager:
             if fields is not None:
                 body["fields"] = fields
 
-            return self._make_request("POST", endpoint, json=body if body else {})
+            return await self._make_request("POST", endpoint, json=body if body else {})
         except httpx.HTTPStatusError as e:
             raise Exception(f"Failed to get documents: {e.response.text}")
         except Exception as e:
             raise Exception(f"Failed to get documents: {str(e)}")
 
-    def get_document(
+    async def get_document(
         self, index_uid: str, document_id: Union[str, int]
     ) -> Dict[str, Any]:
         """Get a single document using GET /indexes/{index_uid}/documents/{document_id}"""
         try:
             endpoint = f"/indexes/{index_uid}/documents/{document_id}"
-            return self._make_request("GET", endpoint)
+            return await self._make_request("GET", endpoint)
         except httpx.HTTPStatusError as e:
             raise Exception(f"Failed to get document: {e.response.text}")
         except Exception as e:
             raise Exception(f"Failed to get document: {str(e)}")
 
-    def add_documents(
+    async def add_documents(
         self,
         index_uid: str,
         documents: List[Dict[str, Any]],
@@ -105,60 +108,62 @@ class DocumentManager:
                 endpoint_with_params += f"?{urlencode(params)}"
 
             http_pool = get_http_pool()
-            client, headers = http_pool.get_client(
+            client, headers = http_pool.get_async_client(
                 self.url,
                 self.api_key,
                 timeout=config.HTTP_TIMEOUT,
             )
-            response = client.put(endpoint_with_params, headers=headers, json=documents)
+            response = await client.put(
+                endpoint_with_params, headers=headers, json=documents
+            )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             raise Exception(f"Failed to add documents: {e.response.text}")
         except Exception as e:
             raise Exception(f"Failed to add documents: {str(e)}")
 
-    def update_documents(
+    async def update_documents(
         self, index_uid: str, documents: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Update documents using PATCH /indexes/{index_uid}/documents"""
         try:
             endpoint = f"/indexes/{index_uid}/documents"
-            return self._make_request("PATCH", endpoint, json=documents)
+            return await self._make_request("PATCH", endpoint, json=documents)
         except httpx.HTTPStatusError as e:
             raise Exception(f"Failed to update documents: {e.response.text}")
         except Exception as e:
             raise Exception(f"Failed to update documents: {str(e)}")
 
-    def delete_document(
+    async def delete_document(
         self, index_uid: str, document_id: Union[str, int]
     ) -> Dict[str, Any]:
         """Delete a single document using DELETE /indexes/{index_uid}/documents/{document_id}"""
         try:
             endpoint = f"/indexes/{index_uid}/documents/{document_id}"
-            return self._make_request("DELETE", endpoint)
+            return await self._make_request("DELETE", endpoint)
         except httpx.HTTPStatusError as e:
             raise Exception(f"Failed to delete document: {e.response.text}")
         except Exception as e:
             raise Exception(f"Failed to delete document: {str(e)}")
 
-    def delete_documents(
+    async def delete_documents(
         self, index_uid: str, document_ids: List[Union[str, int]]
     ) -> Dict[str, Any]:
         """Delete multiple documents by ID using POST /indexes/{index_uid}/documents/delete-batch"""
         try:
             endpoint = f"/indexes/{index_uid}/documents/delete-batch"
-            return self._make_request("POST", endpoint, json=document_ids)
+            return await self._make_request("POST", endpoint, json=document_ids)
         except httpx.HTTPStatusError as e:
             raise Exception(f"Failed to delete documents: {e.response.text}")
         except Exception as e:
             raise Exception(f"Failed to delete documents: {str(e)}")
 
-    def delete_all_documents(self, index_uid: str) -> Dict[str, Any]:
+    async def delete_all_documents(self, index_uid: str) -> Dict[str, Any]:
         """Delete all documents using DELETE /indexes/{index_uid}/documents"""
         try:
             endpoint = f"/indexes/{index_uid}/documents"
-            return self._make_request("DELETE", endpoint)
+            return await self._make_request("DELETE", endpoint)
         except httpx.HTTPStatusError as e:
             raise Exception(f"Failed to delete all documents: {e.response.text}")
         except Exception as e:
@@ -0,0 +1,12 @@
+"""
+Exception types raised by the Meilisearch managers.
+"""
+
+
+class MeilisearchTaskError(Exception):
+    """A task API request was rejected by Meilisearch."""
+
+    def __init__(self, message: str, status_code: int, response_text: str):
+        self.status_code = status_code
+        self.response_text = response_text
+        super().__init__(f"{message} (HTTP {status_code}): {response_text}")
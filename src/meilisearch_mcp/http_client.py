@@ -5,10 +5,59 @@ This module provides a shared HTTP client instance with connection pooling
 to improve performance and resource management.
 """
 
+import asyncio
 import httpx
-from typing import Optional, Dict
+from collections import OrderedDict
+from functools import lru_cache
+from importlib.util import find_spec
+from types import MappingProxyType
+from urllib.parse import urlsplit
+from typing import Any, List, Mapping, Optional, Dict, Union
 import threading
 import logging
+import weakref
+
+from .config import config
+
+_BEARER = "Bearer "
+# httpx needs the h2 package for HTTP/2; without it clients use HTTP/1.1
+_H2_AVAILABLE = find_spec("h2") is not None
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+@lru_cache(maxsize=64)
+def _canonical_url(url: str) -> str:
+    """
+    Normalize a base URL so equivalent spellings share one pooled client.
+
+    Lowercases the scheme and host, drops the scheme's default port and
+    strips trailing slashes from the path.
+    """
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    userinfo, _, _ = parts.netloc.rpartition("@")
+    if userinfo:
+        host = f"{userinfo}@{host}"
+    return f"{scheme}://{host}{parts.path.rstrip('/')}"
+
+
+@lru_cache(maxsize=256)
+def _build_headers(api_key: Optional[str]) -> Mapping[str, str]:
+    """Build the request headers for api_key once; bounded for rotating keys."""
+    headers = {"Content-Type": "application/json"}
+    api_key = api_key.strip() if api_key else None
+    if api_key:
+        headers["Authorization"] = _BEARER + api_key
+    return MappingProxyType(headers)
 
 
 class HTTPClientPool:
@@ -21,8 +70,17 @@ class HTTPClientPool:
 
     _instance: Optional["HTTPClientPool"] = None
     _lock = threading.Lock()
-    _clients: Dict[str, httpx.Client] = {}
-    _client_locks: Dict[str, threading.Lock] = {}
+    # Sync clients in least-recently-used order, bounded by _max_clients
+    _clients: "OrderedDict[str, httpx.Client]" = OrderedDict()
+    _max_clients = 64
+    # Async clients are bound to the event loop they were created on; kept in
+    # least-recently-used order and bounded by _max_clients like sync clients
+    _async_clients: (
+        "OrderedDict[str, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]]"
+    ) = OrderedDict()
+    # One SSL context for every client, so the TLS session cache is shared
+    # and connections to any base URL can resume sessions
+    _ssl_context = httpx.create_ssl_context()
 
     def __new__(cls):
         if cls._instance is None:
@@ -31,7 +89,7 @@ class HTTPClientPool:
                     cls._instance = super().__new__(cls)
         return cls._instance
 
-    def _get_headers(self, api_key: Optional[str] = None) -> Dict[str, str]:
+    def _get_headers(self, api_key: Optional[str] = None) -> Mapping[str, str]:
         """
         Get headers for requests, including authentication if provided.
 
@@ -39,21 +97,64 @@ class HTTPClientPool:
             api_key: Optional API key for authentication
 
         Returns:
-            Dictionary of headers
+            Read-only mapping of headers, shared between calls with the same key
         """
-        headers = {"Content-Type": "application/json"}
-        if api_key and api_key.strip():
-            headers["Authorization"] = f"Bearer {api_key.strip()}"
-        return headers
+        return _build_headers(api_key)
+
+    @staticmethod
+    def _client_options(
+        timeout: float,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the pooling options shared by sync and async clients.
+
+        Keep-alive limits come from the HTTP_* settings unless overridden.
+        HTTP/2 (HTTP_HTTP2, on by default) lets concurrent requests to one host
+        share a connection; servers that do not negotiate it get HTTP/1.1.
+        """
+        limits = httpx.Limits(
+            max_connections=(
+                max_connections
+                if max_connections is not None
+                else config.HTTP_MAX_CONNECTIONS
+            ),
+            max_keepalive_connections=(
+                max_keepalive_connections
+                if max_keepalive_connections is not None
+                else config.HTTP_MAX_KEEPALIVE
+            ),
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+        )
+        return {
+            "timeout": httpx.Timeout(timeout, connect=10.0),
+            "limits": limits,
+            "http2": config.HTTP_HTTP2 and _H2_AVAILABLE,
+            "verify": HTTPClientPool._ssl_context,
+        }
+
+    def _create_client(
+        self,
+        base_url: str,
+        timeout: float,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+    ) -> httpx.Client:
+        """Create a pooled, keep-alive httpx.Client for base_url."""
+        return httpx.Client(
+            base_url=base_url,
+            **self._client_options(timeout, max_connections, max_keepalive_connections),
+        )
 
     def get_client(
         self,
         base_url: str,
         api_key: Optional[str] = None,
         timeout: float = 30.0,
-        max_connections: int = 100,
-        max_keepalive_connections: int = 20,
-    ) -> tuple[httpx.Client, Dict[str, str]]:
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+    ) -> tuple[httpx.Client, Mapping[str, str]]:
         """
         Get or create an HTTP client for a specific base URL.
 
@@ -66,43 +167,228 @@ class HTTPClientPool:
             api_key: Optional API key for authentication (used in returned headers)
             timeout: Request timeout in seconds
             max_connections: Maximum number of connections in pool
+                (defaults to HTTP_MAX_CONNECTIONS)
             max_keepalive_connections: Maximum keepalive connections
+                (defaults to HTTP_MAX_KEEPALIVE)
 
         Returns:
             Tuple of (httpx.Client instance, headers dict with auth)
         """
         # Create a unique key based only on base_url and timeout
         # API key is NOT included to prevent memory leaks on key rotation
+        base_url = _canonical_url(base_url)
         client_key = f"{base_url}:{timeout}"
 
-        if client_key not in self._clients:
-            with self._lock:
-                if client_key not in self._clients:
-                    # Create client with connection pooling
-                    limits = httpx.Limits(
-                        max_connections=max_connections,
-                        max_keepalive_connections=max_keepalive_connections,
-                    )
-                    timeout_config = httpx.Timeout(timeout, connect=10.0)
-
-                    self._clients[client_key] = httpx.Client(
-                        base_url=base_url,
-                        timeout=timeout_config,
-                        limits=limits,
-                        http2=True,  # Enable HTTP/2 for better performance
-                    )
-                    self._client_locks[client_key] = threading.Lock()
+        clients = self._clients
+        client = clients.get(client_key)
+        if client is not None:
+            try:
+                clients.move_to_end(client_key)
+            except KeyError:
+                # Evicted by another thread since the lookup
+                pass
+        else:
+            # setdefault is atomic, so concurrent callers agree on one client
+            # without taking a lock; a losing candidate is closed.
+            candidate = self._create_client(
+                base_url, timeout, max_connections, max_keepalive_connections
+            )
+            client = clients.setdefault(client_key, candidate)
+            if client is not candidate:
+                candidate.close()
+            elif len(clients) > self._max_clients:
+                self._evict_oldest_clients()
 
         # Return client and headers separately
         headers = self._get_headers(api_key)
-        return self._clients[client_key], headers
+        return client, headers
+
+    def _evict_oldest_clients(self) -> None:
+        """Evict least recently used sync clients until within _max_clients."""
+        with self._lock:
+            while len(self._clients) > self._max_clients:
+                client_key, client = self._clients.popitem(last=False)
+                self._close_when_released(client_key, client)
+
+    def get_async_client(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        timeout: float = 30.0,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+    ) -> tuple[httpx.AsyncClient, Mapping[str, str]]:
+        """
+        Get or create an async HTTP client for a specific base URL.
+
+        Clients are keyed like get_client() and are recreated when requested
+        from a different event loop than the one they were created on, since
+        an httpx.AsyncClient cannot be shared across loops.
+
+        Args:
+            base_url: Base URL for the client
+            api_key: Optional API key for authentication (used in returned headers)
+            timeout: Request timeout in seconds
+            max_connections: Maximum number of connections in pool
+                (defaults to HTTP_MAX_CONNECTIONS)
+            max_keepalive_connections: Maximum keepalive connections
+                (defaults to HTTP_MAX_KEEPALIVE)
+
+        Returns:
+            Tuple of (httpx.AsyncClient instance, headers dict with auth)
+        """
+        base_url = _canonical_url(base_url)
+        client_key = f"{base_url}:{timeout}"
+        loop = asyncio.get_running_loop()
+
+        async_clients = self._async_clients
+        with self._lock:
+            entry = async_clients.get(client_key)
+            if entry is not None and entry[0] is loop:
+                async_clients.move_to_end(client_key)
+            else:
+                if entry is not None:
+                    # Bound to another loop: close it there before replacing
+                    self._discard_async_client(client_key, *entry)
+                entry = (
+                    loop,
+                    httpx.AsyncClient(
+                        base_url=base_url,
+                        **self._client_options(
+                            timeout, max_connections, max_keepalive_connections
+                        ),
+                    ),
+                )
+                async_clients[client_key] = entry
+                while len(async_clients) > self._max_clients:
+                    old_key, (old_loop, old_client) = async_clients.popitem(last=False)
+                    self._close_when_released(old_key, old_client, old_loop)
+
+        headers = self._get_headers(api_key)
+        return entry[1], headers
+
+    @staticmethod
+    async def _aclose_async_client(client_key: str, client: httpx.AsyncClient) -> None:
+        """Await client.aclose(), logging rather than raising on failure."""
+        try:
+            await client.aclose()
+        except Exception as e:
+            logging.error(f"Error closing async HTTP client {client_key}: {e}")
+
+    @classmethod
+    def _discard_async_client(
+        cls,
+        client_key: str,
+        loop: asyncio.AbstractEventLoop,
+        client: httpx.AsyncClient,
+    ) -> None:
+        """
+        Schedule aclose() for an async client on the loop that owns it.
+
+        A client whose loop is no longer running cannot be awaited anymore;
+        its connections are released with that loop, so it is just dropped.
+        """
+        if loop.is_running():
+            cls._run_on_loop(loop, cls._aclose_async_client(client_key, client))
+
+    @staticmethod
+    def _run_on_loop(loop: asyncio.AbstractEventLoop, closing: Any) -> None:
+        """Run the closing coroutine as a task on loop, from any thread."""
+        try:
+            loop.call_soon_threadsafe(loop.create_task, closing)
+        except RuntimeError:
+            # The loop closed in the meantime
+            closing.close()
+
+    @classmethod
+    def _close_when_released(
+        cls,
+        client_key: str,
+        client: Union[httpx.Client, httpx.AsyncClient],
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        """
+        Close an evicted client's transports once nothing references it.
+
+        Callers may still be mid-request on a client they got before it was
+        evicted, so it is not closed right away; a finalizer closes its
+        transports when the last reference goes away, on the client's own
+        loop for async clients.
+        """
+        transports = [client._transport]
+        transports.extend(t for t in client._mounts.values() if t is not None)
+        weakref.finalize(client, cls._close_transports, client_key, transports, loop)
+
+    @classmethod
+    def _close_transports(
+        cls,
+        client_key: str,
+        transports: List[Any],
+        loop: Optional[asyncio.AbstractEventLoop],
+    ) -> None:
+        """Close the transports of a released client, logging failures."""
+        if loop is None:
+            for transport in transports:
+                try:
+                    transport.close()
+                except Exception as e:
+                    logging.error(f"Error closing HTTP client {client_key}: {e}")
+        elif loop.is_running():
+            cls._run_on_loop(loop, cls._aclose_transports(client_key, transports))
+
+    @staticmethod
+    async def _aclose_transports(client_key: str, transports: List[Any]) -> None:
+        """Await aclose() on each transport, logging rather than raising."""
+        for transport in transports:
+            try:
+                await transport.aclose()
+            except Exception as e:
+                logging.error(f"Error closing async HTTP client {client_key}: {e}")
+
+    async def prewarm(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Open a keep-alive connection to base_url ahead of the first real request.
+
+        Issues a GET /health on the async client so DNS, TCP and TLS setup are
+        paid at startup. Failures, including OS-level socket errors, are
+        logged and otherwise ignored.
+        """
+        client, headers = self.get_async_client(base_url, api_key, timeout=timeout)
+        try:
+            await client.get("/health", headers=headers)
+        except (httpx.HTTPError, OSError) as e:
+            logging.debug(f"HTTP client prewarm for {base_url} failed: {e}")
+
+    async def aclose_all(self) -> None:
+        """
+        Close all HTTP clients, awaiting the async clients owned by the running loop.
+
+        Async clients created on other loops are closed on their own loop if
+        it is still running, and dropped otherwise.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            async_clients = list(self._async_clients.items())
+            self._async_clients.clear()
+        for client_key, (client_loop, client) in async_clients:
+            if client_loop is loop:
+                await self._aclose_async_client(client_key, client)
+            else:
+                self._discard_async_client(client_key, client_loop, client)
+        self.close_all()
 
     def close_all(self) -> None:
         """
-        Close all HTTP clients and clean up resources.
+        Close all sync HTTP clients and release the async ones.
 
-        Note: Uses synchronous close() since we're using httpx.Client (not AsyncClient).
-        If async cleanup is needed, convert to AsyncClient and use aclose().
+        Async clients can only be closed by awaiting aclose() on their own
+        event loop, so async shutdown paths should call aclose_all() instead;
+        here they are scheduled for closing where possible and dropped.
         """
         with self._lock:
             for client_key, client in list(self._clients.items()):
@@ -115,7 +401,9 @@ class HTTPClientPool:
                     # Log other errors but don't fail on cleanup
                     logging.error(f"Error closing HTTP client {client_key}: {e}")
             self._clients.clear()
-            self._client_locks.clear()
+            for client_key, entry in self._async_clients.items():
+                self._discard_async_client(client_key, *entry)
+            self._async_clients.clear()
 
 
 # Global singleton instance
@@ -8,6 +8,13 @@ import threading
 from queue import Queue
 import asyncio
 
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
 
 class AsyncLogHandler:
     """Asynchronous log handler with buffering"""
@@ -96,19 +103,27 @@ class MCPLogger:
 
     def _log(self, level: str, msg: str, **kwargs):
         """Create structured log entry"""
-        log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "level": level,
-            "message": msg,
-            **kwargs,
-        }
+        level_no = _LEVELS[level]
+        console_enabled = self.logger.isEnabledFor(level_no)
+        file_handler = getattr(self, "file_handler", None)
+        # Skip building the entry entirely when nothing would record it
+        if not console_enabled and file_handler is None:
+            return
 
         # Log to console
-        getattr(self.logger, level.lower())(msg)
+        if console_enabled:
+            self.logger.log(level_no, msg)
 
         # Log structured data to file
-        if hasattr(self, "file_handler"):
-            self.file_handler.emit(log_entry)
+        if file_handler is not None:
+            file_handler.emit(
+                {
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "level": level,
+                    "message": msg,
+                    **kwargs,
+                }
+            )
 
     def debug(self, msg: str, **kwargs):
         self._log("DEBUG", msg, **kwargs)
@@ -1,10 +1,14 @@
+import asyncio
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import httpx
+import orjson
 
-from .indexes import IndexManager
 from .logging import MCPLogger
+from .cache import TTLCache
+from .http_client import get_http_pool
+from .config import config
 
 logger = MCPLogger()
 
@@ -39,51 +43,62 @@ class MonitoringManager:
         self.headers = {"Content-Type": "application/json"}
         if api_key and api_key.strip():
             self.headers["Authorization"] = f"Bearer {api_key.strip()}"
-        # Use IndexManager for getting indexes
-        self.indexes = IndexManager(url, api_key)
+        self._has_auth = "Authorization" in self.headers
+        # Opt-in cache for polled index stats
+        self._cache = TTLCache()
 
-    def _make_request(self, method: str, endpoint: str) -> Dict[str, Any]:
-        """Make HTTP request to Meilisearch API"""
-        request_url = f"{self.url}{endpoint}"
-        has_auth = "Authorization" in self.headers
+    async def _make_request(self, method: str, endpoint: str) -> Dict[str, Any]:
+        """Make HTTP request to Meilisearch API using connection pool"""
+        has_auth = self._has_auth
         logger.debug(
             f"MonitoringManager request: {method} {endpoint}",
-            url=request_url,
+            url=self.url,
             method=method,
             has_auth_header=has_auth,
         )
-        with httpx.Client() as client:
-            response = client.request(
-                method=method, url=request_url, headers=self.headers, timeout=30.0
+        http_pool = get_http_pool()
+        client, headers = http_pool.get_async_client(
+            self.url,
+            self.api_key,
+            timeout=config.HTTP_TIMEOUT,
+        )
+        response = await client.request(method=method, url=endpoint, headers=headers)
+        if response.status_code == 401:
+            logger.error(
+                "Authentication failed",
+                endpoint=endpoint,
+                has_auth_header=has_auth,
+                response_text=response.text[:200],
             )
-            if response.status_code == 401:
-                logger.error(
-                    "Authentication failed",
-                    endpoint=endpoint,
-                    has_auth_header=has_auth,
-                    response_text=response.text[:200],
-                )
-            response.raise_for_status()
-            return response.json()
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
-    def get_health_status(self) -> HealthStatus:
+    async def get_health_status(self) -> HealthStatus:
         """Get comprehensive health status"""
         try:
-            # Get various stats to build health picture
-            stats = self._make_request("GET", "/stats")
-            indexes = self.indexes.list_indexes()
-
-            indexes_info = []
-            for index_data in indexes.get("results", []):
-                index_uid = index_data["uid"]
-                index_stats = self._make_request("GET", f"/indexes/{index_uid}/stats")
-                indexes_info.append(
-                    {
-                        "uid": index_uid,
-                        "documents_count": index_stats["numberOfDocuments"],
-                        "is_indexing": index_stats["isIndexing"],
-                    }
+            # Get various stats to build health picture, concurrently
+            stats, indexes = await asyncio.gather(
+                self._make_request("GET", "/stats"),
+                self._make_request("GET", "/indexes"),
+            )
+
+            index_uids = [
+                index_data["uid"] for index_data in indexes.get("results", [])
+            ]
+            all_index_stats = await asyncio.gather(
+                *(
+                    self._make_request("GET", f"/indexes/{index_uid}/stats")
+                    for index_uid in index_uids
                 )
+            )
+            indexes_info = [
+                {
+                    "uid": index_uid,
+                    "documents_count": index_stats["numberOfDocuments"],
+                    "is_indexing": index_stats["isIndexing"],
+                }
+                for index_uid, index_stats in zip(index_uids, all_index_stats)
+            ]
 
             return HealthStatus(
                 is_healthy=True,
@@ -99,11 +114,20 @@ class MonitoringManager:
         except Exception as e:
             raise Exception(f"Failed to get health status: {str(e)}")
 
-    def get_index_metrics(self, index_uid: str) -> IndexMetrics:
-        """Get detailed metrics for an index using GET /indexes/{index_uid}/stats"""
+    async def get_index_metrics(self, index_uid: str, ttl: float = 0) -> IndexMetrics:
+        """
+        Get detailed metrics for an index using GET /indexes/{index_uid}/stats
+
+        A positive ttl (in seconds) reuses index stats fetched less than ttl
+        seconds ago.
+        """
         try:
             endpoint = f"/indexes/{index_uid}/stats"
-            stats = self._make_request("GET", endpoint)
+            stats = self._cache.get(endpoint, ttl)
+            if stats is None:
+                stats = await self._make_request("GET", endpoint)
+                if ttl > 0:
+                    self._cache.set(endpoint, stats)
 
             return IndexMetrics(
                 number_of_documents=stats["numberOfDocuments"],
@@ -116,11 +140,13 @@ class MonitoringManager:
         except Exception as e:
             raise Exception(f"Failed to get index metrics: {str(e)}")
 
-    def get_system_information(self) -> Dict[str, Any]:
+    async def get_system_information(self) -> Dict[str, Any]:
         """Get system-level information"""
         try:
-            version = self._make_request("GET", "/version")
-            stats = self._make_request("GET", "/stats")
+            version, stats = await asyncio.gather(
+                self._make_request("GET", "/version"),
+                self._make_request("GET", "/stats"),
+            )
 
             return {
                 "version": version,
@@ -8,6 +8,12 @@ to prevent timing attacks.
 import hmac
 import hashlib
 from typing import Optional
+from urllib.parse import urlsplit
+
+_ALLOWED_SCHEMES = frozenset(("http", "https"))
+
+# Masks for every length the default max_length can produce
+_MASKS = tuple("*" * n for n in range(51))
 
 
 def secure_compare(a: Optional[str], b: Optional[str]) -> bool:
@@ -24,8 +30,9 @@ def secure_compare(a: Optional[str], b: Optional[str]) -> bool:
     Returns:
         True if strings are equal, False otherwise
     """
+    # Handled before the comparison: only two Nones are equal
     if a is None or b is None:
-        return a == b
+        return a is b
 
     # Convert to bytes for hmac comparison
     a_bytes = a.encode("utf-8") if isinstance(a, str) else a
@@ -39,27 +46,30 @@ def validate_url(url: str) -> bool:
     """
     Validate URL format and security.
 
+    Only http and https URLs with a network location are accepted. The URL
+    is split with urlsplit rather than matched against a pattern, so the
+    cost is linear in its length whatever the input.
+
     Args:
         url: URL to validate
 
     Returns:
         True if URL is valid and safe
     """
-    from urllib.parse import urlparse
-
+    # Cheap rejection before parsing: a URL with a network location always
+    # contains "://" after its scheme
+    if not isinstance(url, str) or "://" not in url:
+        return False
     try:
-        parsed = urlparse(url)
-        # Only allow http/https
-        if parsed.scheme not in ("http", "https"):
-            return False
-        # Must have netloc
-        if not parsed.netloc:
-            return False
-        # Prevent localhost in production (can be overridden if needed)
-        # This is a basic check - you may want to make it configurable
-        return True
-    except Exception:
+        parsed = urlsplit(url)
+    except ValueError:
         return False
+    return parsed.scheme in _ALLOWED_SCHEMES and bool(parsed.netloc)
+
+
+def _mask(length: int) -> str:
+    """Return a string of length asterisks, shared for common lengths."""
+    return _MASKS[length] if length < len(_MASKS) else "*" * length
 
 
 def sanitize_for_logging(value: Optional[str], max_length: int = 50) -> str:
@@ -77,9 +87,10 @@ def sanitize_for_logging(value: Optional[str], max_length: int = 50) -> str:
         return "None"
     if not value:
         return ""
-    if len(value) > max_length:
+    length = len(value)
+    if length > max_length:
         return value[:max_length] + "..."
     # Mask sensitive data (API keys, tokens, etc.)
-    if len(value) > 8:
-        return value[:4] + "*" * (len(value) - 8) + value[-4:]
-    return "*" * len(value)
+    if length > 8:
+        return value[:4] + _mask(length - 8) + value[-4:]
+    return _mask(length)
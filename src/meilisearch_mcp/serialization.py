@@ -0,0 +1,54 @@
+"""
+JSON serialization helpers for tool responses.
+
+Tool results are serialized with orjson, which handles dicts, lists,
+datetimes, UUIDs and dataclasses natively. Other types are converted by
+``_default``, dispatched on type: sets become lists, decimals become strings,
+and anything else falls back to its ``__dict__`` or ``str()`` representation.
+"""
+
+from decimal import Decimal
+from functools import singledispatch
+from typing import Any, Dict
+
+import orjson
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+_PRETTY_OPTIONS = _OPTIONS | orjson.OPT_INDENT_2
+
+
+# Whether instances of a type carry a __dict__, probed once per type
+_HAS_DICT: Dict[type, bool] = {}
+
+
+@singledispatch
+def _default(obj: Any) -> Any:
+    """Fallback for objects orjson cannot serialize natively."""
+    obj_type = type(obj)
+    has_dict = _HAS_DICT.get(obj_type)
+    if has_dict is None:
+        has_dict = _HAS_DICT[obj_type] = hasattr(obj, "__dict__")
+    if has_dict:
+        return obj.__dict__
+    return str(obj)
+
+
+@_default.register(set)
+@_default.register(frozenset)
+def _(obj: Any) -> Any:
+    return list(obj)
+
+
+@_default.register(Decimal)
+def _(obj: Decimal) -> Any:
+    return str(obj)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a compact JSON string."""
+    return orjson.dumps(obj, default=_default, option=_OPTIONS).decode()
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize obj to a JSON string indented by two spaces."""
+    return orjson.dumps(obj, default=_default, option=_PRETTY_OPTIONS).decode()
@@ -6,12 +6,16 @@ with support for both STDIO and HTTP/SSE transports.
 """
 
 import asyncio
-import json
+import hmac
 import os
 import sys
 import traceback
-from typing import Optional, Dict, Any
+import weakref
+from collections import deque
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 
+import orjson
 from aiohttp import web
 from fastmcp import FastMCP
 
@@ -19,7 +23,7 @@ from .context import ServerContext, get_context, set_context, reset_context
 from .tools import register_all_tools
 from .logging import MCPLogger
 from .config import config
-from .security import secure_compare, validate_url
+from .security import validate_url
 
 # Create FastMCP server instance
 mcp = FastMCP(
@@ -33,6 +37,135 @@ register_all_tools(mcp)
 # Module-level logger
 logger = MCPLogger()
 
+# The initialize result is static for the lifetime of the process
+_INITIALIZE_RESULT = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {},
+        "logging": {},
+        "prompts": {},
+        "resources": {},
+    },
+    "serverInfo": {
+        "name": "meilisearch",
+        "version": "0.6.0",
+    },
+}
+
+# Permissive CORS headers for JSON-RPC "method not found" responses
+_CORS_HEADERS = MappingProxyType(
+    {
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Headers": "*",
+    }
+)
+
+# Pre-serialized bodies for error responses that do not depend on the request
+_SSE_UNAUTHORIZED_BODY = orjson.dumps({"error": "Unauthorized"})
+_UNAUTHORIZED_BODY = orjson.dumps(
+    {"jsonrpc": "2.0", "error": {"code": -32000, "message": "Unauthorized"}}
+)
+_PARSE_ERROR_BODY = orjson.dumps(
+    {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}
+)
+_INVALID_REQUEST_BODY = orjson.dumps(
+    {
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {"code": -32600, "message": "Invalid Request"},
+    }
+)
+
+# prompts/list and resources/list are always empty; only the id varies
+_EMPTY_LIST_TEMPLATES = {
+    "prompts/list": b'{"jsonrpc":"2.0","id":%b,"result":{"prompts":[]}}',
+    "resources/list": b'{"jsonrpc":"2.0","id":%b,"result":{"resources":[]}}',
+}
+
+# Seconds between SSE keepalive comments
+_SSE_KEEPALIVE_INTERVAL = 30.0
+
+# JSON responses larger than this are compressed if the client accepts it
+_COMPRESSION_MIN_BYTES = 1024
+
+# Upper bounds for coalescing pending SSE messages into one write
+_SSE_BATCH_MAX_MESSAGES = 64
+_SSE_BATCH_MAX_BYTES = 64 * 1024
+
+# Upper bound on the background connection prewarm at startup
+_PREWARM_TIMEOUT = 2.0
+
+
+def _json_body_response(
+    body: bytes, status: int = 200, headers: Optional[Mapping[str, str]] = None
+) -> web.Response:
+    """Build a JSON response from an already serialized body."""
+    response = web.Response(
+        body=body,
+        status=status,
+        headers=headers,
+        content_type="application/json",
+    )
+    # Compress larger bodies (tool results, tools/list) when the client
+    # accepts it; small envelopes are not worth the CPU.
+    if len(body) > _COMPRESSION_MIN_BYTES:
+        response.enable_compression()
+    return response
+
+
+def _json_response(
+    data: Any, status: int = 200, headers: Optional[Mapping[str, str]] = None
+) -> web.Response:
+    """Build a JSON response serialized with orjson."""
+    return _json_body_response(orjson.dumps(data), status=status, headers=headers)
+
+
+def _text(text: str) -> Dict[str, str]:
+    """Build an MCP text content item as a plain dict (no model validation)."""
+    return {"type": "text", "text": text}
+
+
+def _tool_error_result(message: str) -> Dict[str, Any]:
+    """Build the tools/call result returned when a tool fails."""
+    return {"content": [_text(f"Error: {message}")]}
+
+
+def _content_item(item: Any) -> Any:
+    """Convert a single tool content item into a JSON-ready dict."""
+    if isinstance(item, str):
+        return _text(item)
+    if hasattr(item, "model_dump"):
+        return item.model_dump(mode="json", exclude_none=True)
+    return item
+
+
+def _format_tool_result(call_result: Any) -> Dict[str, Any]:
+    """Format a tool's return value as an MCP tools/call result."""
+    # FastMCP returns a ToolResult whose content is a list of content models
+    content = getattr(call_result, "content", call_result)
+    if isinstance(content, str):
+        return {"content": [_text(content)]}
+    if isinstance(content, list):
+        return {"content": [_content_item(item) for item in content]}
+    return {"content": [_text(str(content))]}
+
+
+def _tool_input_schema(parameters: Any) -> Dict[str, Any]:
+    """
+    Build a tool's inputSchema from its FastMCP parameters.
+
+    The schema is copied rather than mutated in place, and additionalProperties
+    defaults to False for OpenAI compatibility.
+    """
+    if parameters and isinstance(parameters, dict):
+        schema = dict(parameters)
+    elif parameters and hasattr(parameters, "model_json_schema"):
+        schema = parameters.model_json_schema()
+    else:
+        schema = {"type": "object", "properties": {}}
+    schema.setdefault("additionalProperties", False)
+    return schema
+
 
 def create_server(
     url: Optional[str] = None, api_key: Optional[str] = None
@@ -41,6 +174,27 @@ def create_server(
     return MeilisearchMCPServer(url, api_key)
 
 
+class _Subscriber:
+    """
+    Mailbox for a single SSE connection.
+
+    Broadcasting appends to the deque and sets the event; the SSE loop waits
+    on the event and drains everything that is pending. A ``None`` message
+    closes the stream.
+    """
+
+    __slots__ = ("messages", "event", "__weakref__")
+
+    def __init__(self):
+        self.messages: deque = deque()
+        self.event = asyncio.Event()
+
+    def push(self, message: Optional[Dict[str, Any]]) -> None:
+        """Queue a message and wake up the SSE loop."""
+        self.messages.append(message)
+        self.event.set()
+
+
 class MeilisearchMCPServer:
     """
     Wrapper class for the FastMCP server with HTTP/SSE support.
@@ -50,6 +204,18 @@ class MeilisearchMCPServer:
     Cloud Run deployment.
     """
 
+    # url, api_key, meili_client and chat_manager are properties backed by
+    # the shared ServerContext, so only the per-instance state is slotted.
+    __slots__ = (
+        "logger",
+        "server",
+        "_subscribers",
+        "_tools_list_cache",
+        "_rpc_handlers",
+        "_expected_token",
+        "_prewarm_task",
+    )
+
     def __init__(
         self,
         url: Optional[str] = None,
@@ -71,7 +237,22 @@ class MeilisearchMCPServer:
         set_context(ctx)
 
         self.logger = ctx.logger
-        self._sse_queues: set[asyncio.Queue] = set()
+        # The auth token is fixed for the lifetime of the server; keep it
+        # encoded so each request only encodes the presented token.
+        self._expected_token: Optional[bytes] = (
+            config.MCP_AUTH_TOKEN.encode("utf-8") if config.MCP_AUTH_TOKEN else None
+        )
+        # Held weakly so a subscriber whose handler exits without reaching its
+        # cleanup cannot linger in the broadcast set.
+        self._subscribers: "weakref.WeakSet[_Subscriber]" = weakref.WeakSet()
+        self._tools_list_cache: Optional[tuple] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
+        # JSON-RPC method name -> handler(params, request_id)
+        self._rpc_handlers = {
+            "initialize": self._rpc_initialize,
+            "tools/list": self._rpc_tools_list,
+            "tools/call": self._rpc_tools_call,
+        }
 
         # Keep reference to the FastMCP server
         self.server = mcp._mcp_server
@@ -104,18 +285,17 @@ class MeilisearchMCPServer:
 
     def _verify_token(self, request: web.Request) -> bool:
         """Verify authentication token from request using secure comparison."""
-        expected_token = config.MCP_AUTH_TOKEN
-        if not expected_token:
+        expected_token = self._expected_token
+        if expected_token is None:
             return True
 
-        auth_header = request.headers.get("Authorization", "")
-        if auth_header.startswith("Bearer "):
-            token = auth_header[7:]
-            return secure_compare(token, expected_token)
+        auth_header = request.headers.get("Authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            return hmac.compare_digest(auth_header[7:].encode("utf-8"), expected_token)
 
-        token_header = request.headers.get("X-MCP-Token", "")
+        token_header = request.headers.get("X-MCP-Token")
         if token_header:
-            return secure_compare(token_header, expected_token)
+            return hmac.compare_digest(token_header.encode("utf-8"), expected_token)
 
         return False
 
@@ -123,7 +303,7 @@ class MeilisearchMCPServer:
         """SSE endpoint for MCP protocol - server-to-client communication."""
         if not self._verify_token(request):
             logger.warning("SSE connection rejected: Unauthorized")
-            return web.json_response({"error": "Unauthorized"}, status=401)
+            return _json_body_response(_SSE_UNAUTHORIZED_BODY, status=401)
 
         logger.info("SSE connection established", remote=request.remote)
 
@@ -135,54 +315,27 @@ class MeilisearchMCPServer:
         cors_headers = config.get_cors_headers()
         response.headers.update(cors_headers)
 
-        message_queue: asyncio.Queue = asyncio.Queue()
-        self._sse_queues.add(message_queue)
+        subscriber = _Subscriber()
+        self._subscribers.add(subscriber)
+        keepalive_task: Optional[asyncio.Task] = None
 
         try:
             await response.prepare(request)
             await response.write(b": connection established\n\n")
             await response.drain()
 
+            keepalive_task = asyncio.create_task(
+                self._sse_keepalive(response, subscriber)
+            )
+
             while True:
                 try:
-                    message = await asyncio.wait_for(message_queue.get(), timeout=30.0)
+                    await subscriber.event.wait()
+                    subscriber.event.clear()
 
-                    if message is None:
+                    if not await self._flush_sse_subscriber(response, subscriber):
                         break
 
-                    try:
-                        sse_data = f"data: {json.dumps(message)}\n\n"
-                        await response.write(sse_data.encode())
-                        await response.drain()
-                        logger.debug(
-                            "Sent SSE message",
-                            message_id=(
-                                message.get("id") if isinstance(message, dict) else None
-                            ),
-                        )
-                    except (
-                        ConnectionError,
-                        OSError,
-                        asyncio.CancelledError,
-                    ) as write_error:
-                        logger.debug(
-                            f"SSE write error (connection likely closed): {write_error}"
-                        )
-                        break
-
-                except asyncio.TimeoutError:
-                    try:
-                        await response.write(b": ping\n\n")
-                        await response.drain()
-                    except (
-                        asyncio.CancelledError,
-                        ConnectionError,
-                        OSError,
-                    ) as ping_error:
-                        logger.debug(
-                            f"SSE ping failed (connection closed): {ping_error}"
-                        )
-                        break
                 except asyncio.CancelledError:
                     logger.debug("SSE connection cancelled")
                     break
@@ -205,7 +358,9 @@ class MeilisearchMCPServer:
                 traceback=traceback.format_exc(),
             )
         finally:
-            self._sse_queues.discard(message_queue)
+            if keepalive_task is not None:
+                keepalive_task.cancel()
+            self._subscribers.discard(subscriber)
             try:
                 if not response.prepared:
                     await response.prepare(request)
@@ -216,18 +371,167 @@ class MeilisearchMCPServer:
         logger.info("SSE connection closed", remote=request.remote)
         return response
 
+    async def _sse_keepalive(
+        self, response: web.StreamResponse, subscriber: _Subscriber
+    ) -> None:
+        """
+        Periodically write an SSE comment to keep the connection open.
+
+        Runs as a separate task so message delivery does not need a timer per
+        wait. If the ping cannot be written, the subscriber is told to close.
+        """
+        while True:
+            await asyncio.sleep(_SSE_KEEPALIVE_INTERVAL)
+            try:
+                await response.write(b": ping\n\n")
+                await response.drain()
+            except (ConnectionError, OSError) as ping_error:
+                logger.debug(f"SSE ping failed (connection closed): {ping_error}")
+                subscriber.push(None)
+                return
+
+    async def _flush_sse_subscriber(
+        self, response: web.StreamResponse, subscriber: _Subscriber
+    ) -> bool:
+        """
+        Write every pending message of a subscriber to its SSE stream.
+
+        Returns:
+            False once the stream should be closed, True otherwise
+        """
+        messages = subscriber.messages
+        while messages:
+            # Coalesce whatever is already pending into a single write, bounded
+            # so one large burst does not hold back delivery indefinitely.
+            buffer = bytearray()
+            count = 0
+            closed = False
+            while (
+                messages
+                and count < _SSE_BATCH_MAX_MESSAGES
+                and len(buffer) < _SSE_BATCH_MAX_BYTES
+            ):
+                message = messages.popleft()
+                if message is None:
+                    closed = True
+                    break
+                # Frame straight into the buffer to avoid an intermediate
+                # bytes object per message.
+                buffer += b"data: "
+                buffer += orjson.dumps(message)
+                buffer += b"\n\n"
+                count += 1
+
+            if count:
+                try:
+                    await response.write(buffer)
+                    if not messages:
+                        await response.drain()
+                    logger.debug("Sent SSE messages", count=count)
+                except (
+                    ConnectionError,
+                    OSError,
+                    asyncio.CancelledError,
+                ) as write_error:
+                    logger.debug(
+                        f"SSE write error (connection likely closed): {write_error}"
+                    )
+                    return False
+
+            if closed:
+                return False
+        return True
+
+    async def _rpc_initialize(
+        self, params: Dict[str, Any], request_id: Any
+    ) -> Dict[str, Any]:
+        """Handle the initialize JSON-RPC method."""
+        return _INITIALIZE_RESULT
+
+    async def _rpc_tools_list(
+        self, params: Dict[str, Any], request_id: Any
+    ) -> Dict[str, Any]:
+        """Handle the tools/list JSON-RPC method."""
+        return await self._list_tools()
+
+    async def _rpc_tools_call(
+        self, params: Dict[str, Any], request_id: Any
+    ) -> Dict[str, Any]:
+        """Handle the tools/call JSON-RPC method."""
+        tool_name = params.get("name")
+        tool_args = params.get("arguments", {})
+        return await self._call_tool(tool_name, tool_args, request_id)
+
+    async def _list_tools(self) -> Dict[str, Any]:
+        """
+        Build the tools/list result from the FastMCP tool registry.
+
+        Tool schemas are static, so the result is cached and only rebuilt
+        when the set of registered tool names changes.
+        """
+        all_tools = await mcp._tool_manager.get_tools()
+        tool_names = tuple(all_tools)
+        if self._tools_list_cache is not None:
+            cached_names, cached_result = self._tools_list_cache
+            if cached_names == tool_names:
+                return cached_result
+
+        tools_list = []
+        for tool in all_tools.values():
+            tools_list.append(
+                {
+                    "name": tool.name,
+                    "description": tool.description or "",
+                    "inputSchema": _tool_input_schema(tool.parameters),
+                }
+            )
+
+        logger.info(
+            f"Retrieved {len(tools_list)} tools from handler",
+            tool_count=len(tools_list),
+        )
+        result = {"tools": tools_list}
+        self._tools_list_cache = (tool_names, result)
+        return result
+
+    async def _call_tool(
+        self, tool_name: str, tool_args: Dict[str, Any], request_id: Any
+    ) -> Dict[str, Any]:
+        """Execute a tool via FastMCP and format its result for MCP."""
+        try:
+            call_result = await asyncio.wait_for(
+                mcp._tool_manager.call_tool(tool_name, tool_args),
+                timeout=config.REQUEST_TIMEOUT,
+            )
+            return _format_tool_result(call_result)
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Tool execution timeout: {tool_name}",
+                tool_name=tool_name,
+                request_id=request_id,
+            )
+            return _tool_error_result(
+                "Tool execution timed out after 5 minutes. "
+                "The operation may still be processing."
+            )
+        except Exception as tool_error:
+            error_message = str(tool_error)
+            logger.error(
+                f"Tool execution error: {error_message}",
+                tool_name=tool_name,
+                request_id=request_id,
+                error_type=type(tool_error).__name__,
+                traceback=traceback.format_exc(),
+            )
+            return _tool_error_result(error_message)
+
     async def _mcp_post_endpoint(self, request: web.Request):
         """POST endpoint for MCP protocol - client-to-server communication."""
         if not self._verify_token(request):
             logger.warning("POST request rejected: Unauthorized")
             cors_headers = config.get_cors_headers()
-            return web.json_response(
-                {
-                    "jsonrpc": "2.0",
-                    "error": {"code": -32000, "message": "Unauthorized"},
-                },
-                status=401,
-                headers=cors_headers,
+            return _json_body_response(
+                _UNAUTHORIZED_BODY, status=401, headers=cors_headers
             )
 
         data = None
@@ -244,7 +548,7 @@ class MeilisearchMCPServer:
                     remote=request.remote,
                 )
                 cors_headers = config.get_cors_headers()
-                return web.json_response(
+                return _json_response(
                     {
                         "jsonrpc": "2.0",
                         "id": None,
@@ -258,20 +562,14 @@ class MeilisearchMCPServer:
                 )
 
             try:
-                data = await request.json()
-            except json.JSONDecodeError as e:
+                data = orjson.loads(await request.read())
+            except orjson.JSONDecodeError as e:
                 logger.error(
                     f"Invalid JSON in request body: {e}", remote=request.remote
                 )
                 cors_headers = config.get_cors_headers()
-                return web.json_response(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": None,
-                        "error": {"code": -32700, "message": "Parse error"},
-                    },
-                    status=400,
-                    headers=cors_headers,
+                return _json_body_response(
+                    _PARSE_ERROR_BODY, status=400, headers=cors_headers
                 )
             except Exception as e:
                 logger.error(
@@ -280,14 +578,8 @@ class MeilisearchMCPServer:
                     error_type=type(e).__name__,
                 )
                 cors_headers = config.get_cors_headers()
-                return web.json_response(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": None,
-                        "error": {"code": -32600, "message": "Invalid Request"},
-                    },
-                    status=400,
-                    headers=cors_headers,
+                return _json_body_response(
+                    _INVALID_REQUEST_BODY, status=400, headers=cors_headers
                 )
 
             request_id = data.get("id") if data else None
@@ -302,135 +594,22 @@ class MeilisearchMCPServer:
             if data and data.get("jsonrpc") == "2.0":
                 params = data.get("params", {})
 
-                if method == "initialize":
-                    result = {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {
-                            "tools": {},
-                            "logging": {},
-                            "prompts": {},
-                            "resources": {},
-                        },
-                        "serverInfo": {
-                            "name": "meilisearch",
-                            "version": "0.6.0",
-                        },
-                    }
-                elif method == "tools/list":
-                    # Get tools from FastMCP
-                    tools_list = []
-                    all_tools = await mcp._tool_manager.get_tools()
-                    for tool in all_tools.values():
-                        # Get schema - tool.parameters can be a Pydantic model or dict
-                        if tool.parameters:
-                            if hasattr(tool.parameters, "model_json_schema"):
-                                schema = tool.parameters.model_json_schema()
-                            elif isinstance(tool.parameters, dict):
-                                schema = tool.parameters
-                            else:
-                                schema = {
-                                    "type": "object",
-                                    "properties": {},
-                                    "additionalProperties": False,
-                                }
-                        else:
-                            schema = {
-                                "type": "object",
-                                "properties": {},
-                                "additionalProperties": False,
-                            }
-
-                        tool_dict = {
-                            "name": tool.name,
-                            "description": tool.description or "",
-                            "inputSchema": schema,
-                        }
-                        # Ensure additionalProperties is false for OpenAI compatibility
-                        if "additionalProperties" not in tool_dict["inputSchema"]:
-                            tool_dict["inputSchema"]["additionalProperties"] = False
-                        tools_list.append(tool_dict)
-
-                    logger.info(
-                        f"Retrieved {len(tools_list)} tools from handler",
-                        tool_count=len(tools_list),
-                    )
-                    result = {"tools": tools_list}
-
-                elif method == "tools/call":
-                    tool_name = params.get("name")
-                    tool_args = params.get("arguments", {})
-
-                    try:
-                        # Execute tool via FastMCP
-                        call_result = await asyncio.wait_for(
-                            mcp._tool_manager.call_tool(tool_name, tool_args),
-                            timeout=config.REQUEST_TIMEOUT,
-                        )
-
-                        # Format result for MCP protocol
-                        if isinstance(call_result, str):
-                            result = {
-                                "content": [{"type": "text", "text": call_result}]
-                            }
-                        elif isinstance(call_result, list):
-                            result = {
-                                "content": [
-                                    (
-                                        {"type": "text", "text": str(item)}
-                                        if isinstance(item, str)
-                                        else item
-                                    )
-                                    for item in call_result
-                                ]
-                            }
-                        else:
-                            result = {
-                                "content": [{"type": "text", "text": str(call_result)}]
-                            }
-
-                    except asyncio.TimeoutError:
-                        logger.error(
-                            f"Tool execution timeout: {tool_name}",
-                            tool_name=tool_name,
-                            request_id=request_id,
-                        )
-                        result = {
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": f"Error: Tool execution timed out after 5 minutes. The operation may still be processing.",
-                                }
-                            ]
-                        }
-                    except Exception as tool_error:
-                        logger.error(
-                            f"Tool execution error: {tool_error}",
-                            tool_name=tool_name,
-                            request_id=request_id,
-                            error_type=type(tool_error).__name__,
-                            traceback=traceback.format_exc(),
-                        )
-                        result = {
-                            "content": [
-                                {"type": "text", "text": f"Error: {str(tool_error)}"}
-                            ]
-                        }
-
-                elif method == "prompts/list":
-                    logger.info("Received prompts/list request - returning empty list")
-                    result = {"prompts": []}
-                elif method == "resources/list":
-                    logger.info(
-                        "Received resources/list request - returning empty list"
+                empty_list_template = _EMPTY_LIST_TEMPLATES.get(method)
+                if empty_list_template is not None:
+                    logger.debug(f"Received {method} request - returning empty list")
+                    return _json_body_response(
+                        empty_list_template % orjson.dumps(request_id),
+                        headers=config.get_cors_headers(),
                     )
-                    result = {"resources": []}
-                else:
+
+                handler = self._rpc_handlers.get(method)
+                if handler is None:
                     logger.warning(
                         f"Unknown method requested: {method}",
                         method=method,
                         request_id=request_id,
                     )
-                    return web.json_response(
+                    return _json_response(
                         {
                             "jsonrpc": "2.0",
                             "id": request_id,
@@ -440,11 +619,9 @@ class MeilisearchMCPServer:
                             },
                         },
                         status=200,
-                        headers={
-                            "Access-Control-Allow-Origin": "*",
-                            "Access-Control-Allow-Headers": "*",
-                        },
+                        headers=_CORS_HEADERS,
                     )
+                result = await handler(params, request_id)
 
                 response_data = {
                     "jsonrpc": "2.0",
@@ -459,14 +636,14 @@ class MeilisearchMCPServer:
                     "prompts/list",
                     "resources/list",
                 ]
-                if method in methods_via_post or not self._sse_queues:
+                if method in methods_via_post or not self._subscribers:
                     logger.info(
                         f"Returning HTTP response for method {method}",
                         request_id=request_id,
                         via_post=True,
                     )
                     cors_headers = config.get_cors_headers()
-                    return web.json_response(
+                    return _json_response(
                         response_data,
                         headers=cors_headers,
                     )
@@ -474,19 +651,12 @@ class MeilisearchMCPServer:
                     logger.info(
                         f"Sending response via SSE for method {method}",
                         request_id=request_id,
-                        queue_count=len(self._sse_queues),
+                        subscriber_count=len(self._subscribers),
                     )
-                    sent_count = 0
-                    for queue in self._sse_queues:
-                        try:
-                            await queue.put(response_data)
-                            sent_count += 1
-                            logger.debug(
-                                f"Queued message for SSE stream {sent_count}",
-                                request_id=request_id,
-                            )
-                        except Exception as e:
-                            logger.error(f"Failed to send via SSE queue: {e}")
+                    subscribers = list(self._subscribers)
+                    for subscriber in subscribers:
+                        subscriber.push(response_data)
+                    sent_count = len(subscribers)
                     logger.info(
                         f"Queued response to {sent_count} SSE stream(s) for method {method}",
                         request_id=request_id,
@@ -498,7 +668,7 @@ class MeilisearchMCPServer:
                     )
             else:
                 cors_headers = config.get_cors_headers()
-                return web.json_response(
+                return _json_response(
                     {
                         "jsonrpc": "2.0",
                         "id": request_id,
@@ -525,7 +695,7 @@ class MeilisearchMCPServer:
             error_message = str(e) if e else "Internal error"
             try:
                 cors_headers = config.get_cors_headers()
-                return web.json_response(
+                return _json_response(
                     {
                         "jsonrpc": "2.0",
                         "id": request_id,
@@ -555,11 +725,11 @@ class MeilisearchMCPServer:
             try:
                 is_healthy = self.meili_client.health_check()
                 if is_healthy:
-                    return web.json_response(
+                    return _json_response(
                         {"status": "healthy", "service": "meilisearch-mcp"}, status=200
                     )
                 else:
-                    return web.json_response(
+                    return _json_response(
                         {
                             "status": "degraded",
                             "service": "meilisearch-mcp",
@@ -568,7 +738,7 @@ class MeilisearchMCPServer:
                         status=503,
                     )
             except Exception as e:
-                return web.json_response(
+                return _json_response(
                     {"status": "error", "service": "meilisearch-mcp", "error": str(e)},
                     status=503,
                 )
@@ -580,20 +750,6 @@ class MeilisearchMCPServer:
                 return await self._mcp_sse_endpoint(request)
             return await health_check(request)
 
-        app.router.add_get("/", root_handler)
-        app.router.add_get("/health", health_check)
-        app.router.add_get("/ready", health_check)
-
-        # MCP endpoints
-        app.router.add_get("/mcp", self._mcp_sse_endpoint)
-        app.router.add_post("/mcp", self._mcp_post_endpoint)
-        app.router.add_get("/sse", self._mcp_sse_endpoint)
-        app.router.add_post("/sse", self._mcp_post_endpoint)
-        app.router.add_get("/v1/sse", self._mcp_sse_endpoint)
-        app.router.add_post("/v1/sse", self._mcp_post_endpoint)
-        app.router.add_post("/message", self._mcp_post_endpoint)
-        app.router.add_post("/v1/message", self._mcp_post_endpoint)
-
         # CORS preflight handler
         async def options_handler(request):
             cors_headers = config.get_cors_headers()
@@ -602,12 +758,23 @@ class MeilisearchMCPServer:
                 headers=cors_headers,
             )
 
-        app.router.add_options("/", options_handler)
-        app.router.add_options("/mcp", options_handler)
-        app.router.add_options("/sse", options_handler)
-        app.router.add_options("/v1/sse", options_handler)
-        app.router.add_options("/message", options_handler)
-        app.router.add_options("/v1/message", options_handler)
+        routes = [
+            web.get("/", root_handler),
+            web.get("/health", health_check),
+            web.get("/ready", health_check),
+        ]
+
+        # MCP endpoints: SSE stream on GET, JSON-RPC messages on POST
+        for path in ("/mcp", "/sse", "/v1/sse"):
+            routes.append(web.get(path, self._mcp_sse_endpoint))
+            routes.append(web.post(path, self._mcp_post_endpoint))
+        for path in ("/message", "/v1/message"):
+            routes.append(web.post(path, self._mcp_post_endpoint))
+
+        for path in ("/", "/mcp", "/sse", "/v1/sse", "/message", "/v1/message"):
+            routes.append(web.options(path, options_handler))
+
+        app.add_routes(routes)
 
         logger.info("Registered HTTP routes:")
         for route in app.router.routes():
@@ -616,7 +783,14 @@ class MeilisearchMCPServer:
         return app
 
     async def run(self):
-        """Run the MCP server, optionally with HTTP health check for Cloud Run."""
+        """Run the MCP server, closing its HTTP clients when it stops."""
+        try:
+            await self._serve()
+        finally:
+            await self.acleanup()
+
+    async def _serve(self):
+        """Serve MCP, optionally with HTTP health check for Cloud Run."""
         port = config.PORT
 
         if port:
@@ -660,10 +834,37 @@ class MeilisearchMCPServer:
     async def _run_mcp_server(self):
         """Run the MCP server on stdio using FastMCP."""
         logger.info("Starting Meilisearch MCP server...")
+        # Prewarm in the background so a slow or unreachable Meilisearch never
+        # delays the stdio handshake; the reference keeps the task alive.
+        self._prewarm_task = asyncio.create_task(self._prewarm_http_pool())
         await mcp.run_async(transport="stdio")
 
+    async def _prewarm_http_pool(self):
+        """Warm the pooled connection to Meilisearch, giving up after a short wait."""
+        from .http_client import get_http_pool
+
+        ctx = get_context()
+        try:
+            await asyncio.wait_for(
+                get_http_pool().prewarm(
+                    ctx.url, ctx.api_key, timeout=config.HTTP_TIMEOUT
+                ),
+                _PREWARM_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            logger.debug("HTTP client prewarm timed out", url=ctx.url)
+
+    async def acleanup(self):
+        """Clean shutdown from async code, awaiting the async HTTP clients."""
+        from .http_client import get_http_pool
+
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
+        await get_http_pool().aclose_all()
+        reset_context()
+
     def cleanup(self):
-        """Clean shutdown."""
+        """Clean shutdown from sync code; prefer acleanup() inside an event loop."""
         from .http_client import get_http_pool
 
         # Close HTTP clients
@@ -674,6 +875,17 @@ class MeilisearchMCPServer:
         reset_context()
 
 
+def _run_event_loop(main_coro) -> None:
+    """Run main_coro to completion, on a uvloop event loop when available."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main_coro)
+        return
+    logger.debug("Using uvloop event loop")
+    uvloop.run(main_coro)
+
+
 def main():
     """Main entry point."""
     # Validate configuration
@@ -685,7 +897,7 @@ def main():
         sys.exit(1)
 
     server = create_server()
-    asyncio.run(server.run())
+    _run_event_loop(server.run())
 
 
 if __name__ == "__main__":
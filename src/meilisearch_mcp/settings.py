@@ -1,8 +1,11 @@
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 import httpx
+import orjson
 
 from .logging import MCPLogger
+from .http_client import get_http_pool
+from .config import config
 
 logger = MCPLogger()
 
@@ -31,64 +34,65 @@ class SettingsManager:
         self.headers = {"Content-Type": "application/json"}
         if api_key and api_key.strip():
             self.headers["Authorization"] = f"Bearer {api_key.strip()}"
+        self._has_auth = "Authorization" in self.headers
 
-    def _make_request(
+    async def _make_request(
         self, method: str, endpoint: str, json: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Make HTTP request to Meilisearch API"""
-        request_url = f"{self.url}{endpoint}"
-        has_auth = "Authorization" in self.headers
+        """Make HTTP request to Meilisearch API using connection pool"""
+        has_auth = self._has_auth
         logger.debug(
             f"SettingsManager request: {method} {endpoint}",
-            url=request_url,
+            url=self.url,
             method=method,
             has_auth_header=has_auth,
         )
-        with httpx.Client() as client:
-            response = client.request(
-                method=method,
-                url=request_url,
-                headers=self.headers,
-                json=json,
-                timeout=30.0,
+        http_pool = get_http_pool()
+        client, headers = http_pool.get_async_client(
+            self.url,
+            self.api_key,
+            timeout=config.HTTP_TIMEOUT,
+        )
+        response = await client.request(
+            method=method, url=endpoint, json=json, headers=headers
+        )
+        if response.status_code == 401:
+            logger.error(
+                "Authentication failed",
+                endpoint=endpoint,
+                has_auth_header=has_auth,
+                response_text=response.text[:200],
             )
-            if response.status_code == 401:
-                logger.error(
-                    "Authentication failed",
-                    endpoint=endpoint,
-                    has_auth_header=has_auth,
-                    response_text=response.text[:200],
-                )
-            response.raise_for_status()
-            return response.json()
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
-    def get_settings(self, index_uid: str) -> Dict[str, Any]:
+    async def get_settings(self, index_uid: str) -> Dict[str, Any]:
         """Get all settings for an index using GET /indexes/{index_uid}/settings"""
         try:
             endpoint = f"/indexes/{index_uid}/settings"
-            return self._make_request("GET", endpoint)
+            return await self._make_request("GET", endpoint)
         except httpx.HTTPStatusError as e:
             raise Exception(f"Failed to get settings: {e.response.text}")
         except Exception as e:
             raise Exception(f"Failed to get settings: {str(e)}")
 
-    def update_settings(
+    async def update_settings(
         self, index_uid: str, settings: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Update settings for an index using PATCH /indexes/{index_uid}/settings"""
         try:
             endpoint = f"/indexes/{index_uid}/settings"
-            return self._make_request("PATCH", endpoint, json=settings)
+            return await self._make_request("PATCH", endpoint, json=settings)
         except httpx.HTTPStatusError as e:
             raise Exception(f"Failed to update settings: {e.response.text}")
         except Exception as e:
             raise Exception(f"Failed to update settings: {str(e)}")
 
-    def reset_settings(self, index_uid: str) -> Dict[str, Any]:
+    async def reset_settings(self, index_uid: str) -> Dict[str, Any]:
         """Reset settings to default values using DELETE /indexes/{index_uid}/settings"""
         try:
             endpoint = f"/indexes/{index_uid}/settings"
-            return self._make_request("DELETE", endpoint)
+            return await self._make_request("DELETE", endpoint)
         except httpx.HTTPStatusError as e:
             raise Exception(f"Failed to reset settings: {e.response.text}")
         except Exception as e:
@@ -1,11 +1,18 @@
 from typing import Dict, Any, List, Optional, Union
-from urllib.parse import urlencode
 import httpx
+import orjson
 
 from .logging import MCPLogger
+from .cache import TTLCache
+from .http_client import get_http_pool
+from .config import config
+from .exceptions import MeilisearchTaskError
 
 logger = MCPLogger()
 
+# Parameter types sent to Meilisearch as comma-separated lists
+_SEQ_TYPES = frozenset({list, tuple})
+
 
 class TaskManager:
     def __init__(self, url: str, api_key: Optional[str] = None):
@@ -15,10 +22,15 @@ class TaskManager:
         self.headers = {"Content-Type": "application/json"}
         if api_key and api_key.strip():
             self.headers["Authorization"] = f"Bearer {api_key.strip()}"
+        self._has_auth = "Authorization" in self.headers
+        # Bound once; debug logging runs on every poll
+        self._log_debug = logger.debug
+        # Opt-in cache for polled task listings
+        self._cache = TTLCache()
 
     def _build_query_params(
         self, parameters: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, str]:
+    ) -> Dict[str, Any]:
         """Build query parameters from dict, converting lists to comma-separated strings"""
         if not parameters:
             return {}
@@ -26,81 +38,118 @@ class TaskManager:
         for key, value in parameters.items():
             if value is None:
                 continue
-            if isinstance(value, (list, tuple)):
-                # Convert list to comma-separated string
-                params[key] = ",".join(str(v) for v in value)
+            if type(value) in _SEQ_TYPES:
+                # Meilisearch expects lists as comma-separated strings
+                params[key] = ",".join(map(str, value))
             else:
-                params[key] = str(value)
+                # httpx encodes scalars itself (booleans as "true"/"false")
+                params[key] = value
         return params
 
-    def _make_request(
-        self, method: str, endpoint: str, params: Optional[Dict[str, str]] = None
+    async def _make_request(
+        self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Make HTTP request to Meilisearch API"""
-        request_url = f"{self.url}{endpoint}"
-        if params:
-            request_url += f"?{urlencode(params)}"
-
-        has_auth = "Authorization" in self.headers
-        logger.debug(
+        """Make HTTP request to Meilisearch API using connection pool"""
+        has_auth = self._has_auth
+        self._log_debug(
             f"TaskManager request: {method} {endpoint}",
-            url=request_url,
+            url=self.url,
             method=method,
             has_auth_header=has_auth,
         )
-        with httpx.Client() as client:
-            response = client.request(
-                method=method, url=request_url, headers=self.headers, timeout=30.0
+        http_pool = get_http_pool()
+        client, headers = http_pool.get_async_client(
+            self.url,
+            self.api_key,
+            timeout=config.HTTP_TIMEOUT,
+        )
+        # httpx encodes the query string from params
+        response = await client.request(
+            method=method, url=endpoint, params=params, headers=headers
+        )
+        self._log_debug(
+            f"TaskManager response: {response.status_code}",
+            endpoint=endpoint,
+            http_version=response.http_version,
+        )
+        if response.status_code == 401:
+            logger.error(
+                "Authentication failed",
+                endpoint=endpoint,
+                has_auth_header=has_auth,
+                response_text=response.text[:200],
             )
-            if response.status_code == 401:
-                logger.error(
-                    "Authentication failed",
-                    endpoint=endpoint,
-                    has_auth_header=has_auth,
-                    response_text=response.text[:200],
-                )
-            response.raise_for_status()
-            return response.json()
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
-    def get_task(self, task_uid: int) -> Dict[str, Any]:
+    async def get_task(self, task_uid: int) -> Dict[str, Any]:
         """Get information about a specific task using GET /tasks/{task_uid}"""
         try:
             endpoint = f"/tasks/{task_uid}"
-            return self._make_request("GET", endpoint)
+            return await self._make_request("GET", endpoint)
         except httpx.HTTPStatusError as e:
-            raise Exception(f"Failed to get task: {e.response.text}")
-        except Exception as e:
-            raise Exception(f"Failed to get task: {str(e)}")
+            raise MeilisearchTaskError(
+                "Failed to get task", e.response.status_code, e.response.text[:200]
+            ) from e
+
+    async def get_tasks_batch(self, task_uids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get several tasks in one round trip using GET /tasks?uids=..."""
+        try:
+            if not task_uids:
+                return {}
+            params = self._build_query_params(
+                {"uids": task_uids, "limit": len(task_uids)}
+            )
+            response = await self._make_request("GET", "/tasks", params)
+            return {task["uid"]: task for task in response.get("results", [])}
+        except httpx.HTTPStatusError as e:
+            raise MeilisearchTaskError(
+                "Failed to get tasks", e.response.status_code, e.response.text[:200]
+            ) from e
+
+    async def get_tasks(
+        self, parameters: Optional[Dict[str, Any]] = None, ttl: float = 0
+    ) -> Dict[str, Any]:
+        """
+        Get list of tasks with optional filters using GET /tasks
 
-    def get_tasks(self, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Get list of tasks with optional filters using GET /tasks"""
+        A positive ttl (in seconds) returns a cached response for the same
+        filters if it was fetched less than ttl seconds ago.
+        """
         try:
             endpoint = "/tasks"
             params = self._build_query_params(parameters)
-            return self._make_request("GET", endpoint, params)
+            cache_key = (endpoint, tuple(sorted(params.items())))
+            cached = self._cache.get(cache_key, ttl)
+            if cached is not None:
+                return cached
+            tasks = await self._make_request("GET", endpoint, params)
+            if ttl > 0:
+                self._cache.set(cache_key, tasks)
+            return tasks
         except httpx.HTTPStatusError as e:
-            raise Exception(f"Failed to get tasks: {e.response.text}")
-        except Exception as e:
-            raise Exception(f"Failed to get tasks: {str(e)}")
+            raise MeilisearchTaskError(
+                "Failed to get tasks", e.response.status_code, e.response.text[:200]
+            ) from e
 
-    def cancel_tasks(self, query_parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def cancel_tasks(self, query_parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Cancel tasks based on query parameters using POST /tasks/cancel"""
         try:
             endpoint = "/tasks/cancel"
             params = self._build_query_params(query_parameters)
-            return self._make_request("POST", endpoint, params)
+            return await self._make_request("POST", endpoint, params)
         except httpx.HTTPStatusError as e:
-            raise Exception(f"Failed to cancel tasks: {e.response.text}")
-        except Exception as e:
-            raise Exception(f"Failed to cancel tasks: {str(e)}")
+            raise MeilisearchTaskError(
+                "Failed to cancel tasks", e.response.status_code, e.response.text[:200]
+            ) from e
 
-    def delete_tasks(self, query_parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def delete_tasks(self, query_parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Delete tasks based on query parameters using DELETE /tasks"""
         try:
             endpoint = "/tasks"
             params = self._build_query_params(query_parameters)
-            return self._make_request("DELETE", endpoint, params)
+            return await self._make_request("DELETE", endpoint, params)
         except httpx.HTTPStatusError as e:
-            raise Exception(f"Failed to delete tasks: {e.response.text}")
-        except Exception as e:
-            raise Exception(f"Failed to delete tasks: {str(e)}")
+            raise MeilisearchTaskError(
+                "Failed to delete tasks", e.response.status_code, e.response.text[:200]
+            ) from e
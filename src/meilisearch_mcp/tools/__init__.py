@@ -3,17 +3,28 @@ MCP Tools package for Meilisearch.
 
 This package contains all tool definitions organized by category.
 Each module registers its tools with the FastMCP server instance.
+Tool modules are imported on first use rather than with the package.
+
+Tool handlers call ``get_context()`` on each invocation instead of capturing
+the context at registration: tools are registered when the server module is
+imported, before ``MeilisearchMCPServer`` installs its context with
+``set_context()``, and tests swap the context between calls.
 """
 
-from .connection import register_connection_tools
-from .monitoring import register_monitoring_tools
-from .indexes import register_index_tools
-from .documents import register_document_tools
-from .settings import register_settings_tools
-from .search import register_search_tools
-from .tasks import register_task_tools
-from .keys import register_key_tools
-from .chat import register_chat_tools
+from importlib import import_module
+
+# Registration function for each tool module, in registration order
+_REGISTRARS = {
+    "register_connection_tools": "connection",
+    "register_monitoring_tools": "monitoring",
+    "register_index_tools": "indexes",
+    "register_document_tools": "documents",
+    "register_settings_tools": "settings",
+    "register_search_tools": "search",
+    "register_task_tools": "tasks",
+    "register_key_tools": "keys",
+    "register_chat_tools": "chat",
+}
 
 
 def register_all_tools(mcp) -> None:
@@ -23,26 +34,17 @@ def register_all_tools(mcp) -> None:
     Args:
         mcp: The FastMCP server instance
     """
-    register_connection_tools(mcp)
-    register_monitoring_tools(mcp)
-    register_index_tools(mcp)
-    register_document_tools(mcp)
-    register_settings_tools(mcp)
-    register_search_tools(mcp)
-    register_task_tools(mcp)
-    register_key_tools(mcp)
-    register_chat_tools(mcp)
-
-
-__all__ = [
-    "register_all_tools",
-    "register_connection_tools",
-    "register_monitoring_tools",
-    "register_index_tools",
-    "register_document_tools",
-    "register_settings_tools",
-    "register_search_tools",
-    "register_task_tools",
-    "register_key_tools",
-    "register_chat_tools",
-]
+    for name, module_name in _REGISTRARS.items():
+        module = import_module(f".{module_name}", __name__)
+        getattr(module, name)(mcp)
+
+
+def __getattr__(name: str):
+    """Import a tool module when one of its register functions is accessed."""
+    module_name = _REGISTRARS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module_name}", __name__), name)
+
+
+__all__ = ["register_all_tools", *_REGISTRARS]
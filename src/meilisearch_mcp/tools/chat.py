@@ -4,20 +4,12 @@ Chat completion tools for Meilisearch MCP server.
 These tools provide chat completion functionality using Meilisearch's chat feature.
 """
 
-import json
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from ..context import get_context
+from ..serialization import dumps_pretty
 
-
-def json_serializer(obj: Any) -> str:
-    """Custom JSON serializer for objects not serializable by default json code."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    if hasattr(obj, "__dict__"):
-        return obj.__dict__
-    return str(obj)
+_WORKSPACES_HEADER = "Chat workspaces:\n"
 
 
 def register_chat_tools(mcp) -> None:
@@ -70,8 +62,8 @@ def register_chat_tools(mcp) -> None:
             offset=offset,
             limit=limit,
         )
-        formatted_json = json.dumps(workspaces, indent=2, default=json_serializer)
-        return f"Chat workspaces:\n{formatted_json}"
+        formatted_json = dumps_pretty(workspaces)
+        return _WORKSPACES_HEADER + formatted_json
 
     @mcp.tool(name="get-chat-workspace-settings")
     async def get_chat_workspace_settings(workspace_uid: str) -> str:
@@ -88,7 +80,7 @@ def register_chat_tools(mcp) -> None:
         settings = await ctx.chat_manager.get_chat_workspace_settings(
             workspace_uid=workspace_uid
         )
-        formatted_json = json.dumps(settings, indent=2, default=json_serializer)
+        formatted_json = dumps_pretty(settings)
         return f"Workspace settings for '{workspace_uid}':\n{formatted_json}"
 
     @mcp.tool(name="update-chat-workspace-settings")
@@ -110,5 +102,5 @@ def register_chat_tools(mcp) -> None:
             workspace_uid=workspace_uid,
             settings=settings,
         )
-        formatted_json = json.dumps(updated_settings, indent=2, default=json_serializer)
+        formatted_json = dumps_pretty(updated_settings)
         return f"Updated workspace settings for '{workspace_uid}':\n{formatted_json}"
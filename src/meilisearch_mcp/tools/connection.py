@@ -15,11 +15,7 @@ def register_connection_tools(mcp) -> None:
     @mcp.tool(name="get-connection-settings")
     def get_connection_settings() -> str:
         """Get current Meilisearch connection settings."""
-        ctx = get_context()
-        api_key_display = "*" * 8 if ctx.api_key else "Not set"
-        return (
-            f"Current connection settings:\nURL: {ctx.url}\nAPI Key: {api_key_display}"
-        )
+        return get_context().connection_summary
 
     @mcp.tool(name="update-connection-settings")
     def update_connection_settings(
@@ -4,27 +4,19 @@ Index management tools for Meilisearch MCP server.
 These tools handle creating, listing, and deleting Meilisearch indexes.
 """
 
-import json
-from datetime import datetime
-from typing import Any, Optional
+from typing import Optional
 
 from ..context import get_context
+from ..serialization import dumps_pretty
 
-
-def json_serializer(obj: Any) -> str:
-    """Custom JSON serializer for objects not serializable by default json code."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    if hasattr(obj, "__dict__"):
-        return obj.__dict__
-    return str(obj)
+_INDEXES_HEADER = "Indexes:\n"
 
 
 def register_index_tools(mcp) -> None:
     """Register index management tools with the FastMCP server."""
 
     @mcp.tool(name="create-index")
-    def create_index(uid: str, primaryKey: Optional[str] = None) -> str:
+    async def create_index(uid: str, primaryKey: Optional[str] = None) -> str:
         """
         Create a new Meilisearch index.
 
@@ -36,19 +28,19 @@ def register_index_tools(mcp) -> None:
             Confirmation of index creation
         """
         ctx = get_context()
-        result = ctx.meili_client.indexes.create_index(uid, primaryKey)
+        result = await ctx.meili_client.indexes.create_index(uid, primaryKey)
         return f"Created index: {result}"
 
     @mcp.tool(name="list-indexes")
-    def list_indexes() -> str:
+    async def list_indexes() -> str:
         """List all Meilisearch indexes."""
         ctx = get_context()
-        indexes = ctx.meili_client.get_indexes()
-        formatted_json = json.dumps(indexes, indent=2, default=json_serializer)
-        return f"Indexes:\n{formatted_json}"
+        indexes = await ctx.meili_client.get_indexes()
+        formatted_json = dumps_pretty(indexes)
+        return _INDEXES_HEADER + formatted_json
 
     @mcp.tool(name="delete-index")
-    def delete_index(uid: str) -> str:
+    async def delete_index(uid: str) -> str:
         """
         Delete a Meilisearch index.
 
@@ -59,5 +51,5 @@ def register_index_tools(mcp) -> None:
             Confirmation of deletion
         """
         ctx = get_context()
-        ctx.meili_client.indexes.delete_index(uid)
+        await ctx.meili_client.indexes.delete_index(uid)
         return f"Successfully deleted index: {uid}"
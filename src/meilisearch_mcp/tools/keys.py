@@ -13,7 +13,9 @@ def register_key_tools(mcp) -> None:
     """Register API key management tools with the FastMCP server."""
 
     @mcp.tool(name="get-keys")
-    def get_keys(offset: Optional[int] = None, limit: Optional[int] = None) -> str:
+    async def get_keys(
+        offset: Optional[int] = None, limit: Optional[int] = None
+    ) -> str:
         """
         Get list of API keys.
 
@@ -26,17 +28,14 @@ def register_key_tools(mcp) -> None:
         """
         ctx = get_context()
 
-        params = {}
-        if offset is not None:
-            params["offset"] = offset
-        if limit is not None:
-            params["limit"] = limit
+        raw_params = {"offset": offset, "limit": limit}
+        params = {key: value for key, value in raw_params.items() if value is not None}
 
-        keys = ctx.meili_client.keys.get_keys(params if params else None)
+        keys = await ctx.meili_client.keys.get_keys(params if params else None)
         return f"API keys: {keys}"
 
     @mcp.tool(name="create-key")
-    def create_key(
+    async def create_key(
         actions: List[str],
         indexes: List[str],
         description: Optional[str] = None,
@@ -65,11 +64,11 @@ def register_key_tools(mcp) -> None:
         if expiresAt is not None:
             key_config["expiresAt"] = expiresAt
 
-        key = ctx.meili_client.keys.create_key(key_config)
+        key = await ctx.meili_client.keys.create_key(key_config)
         return f"Created API key: {key}"
 
     @mcp.tool(name="delete-key")
-    def delete_key(key: str) -> str:
+    async def delete_key(key: str) -> str:
         """
         Delete an API key.
 
@@ -80,5 +79,5 @@ def register_key_tools(mcp) -> None:
             Confirmation of deletion
         """
         ctx = get_context()
-        ctx.meili_client.keys.delete_key(key)
+        await ctx.meili_client.keys.delete_key(key)
         return f"Successfully deleted API key: {key}"
@@ -4,20 +4,15 @@ Monitoring and health check tools for Meilisearch MCP server.
 These tools provide health checks, version info, stats, and system information.
 """
 
-import json
-from datetime import datetime
-from typing import Any
+from typing import Optional
 
 from ..context import get_context
+from ..serialization import dumps
 
 
-def json_serializer(obj: Any) -> str:
-    """Custom JSON serializer for objects not serializable by default json code."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    if hasattr(obj, "__dict__"):
-        return obj.__dict__
-    return str(obj)
+def _ttl_seconds(ttl_ms: Optional[int]) -> float:
+    """Convert an optional ttlMs tool argument to seconds (0 disables caching)."""
+    return ttl_ms / 1000 if ttl_ms else 0
 
 
 def register_monitoring_tools(mcp) -> None:
@@ -32,51 +27,70 @@ def register_monitoring_tools(mcp) -> None:
         return f"Meilisearch is {status}"
 
     @mcp.tool(name="get-version")
-    def get_version() -> str:
-        """Get Meilisearch version information."""
+    def get_version(ttlMs: Optional[int] = None) -> str:
+        """
+        Get Meilisearch version information.
+
+        Args:
+            ttlMs: Reuse a response fetched less than this many milliseconds ago
+
+        Returns:
+            Version information
+        """
         ctx = get_context()
-        version = ctx.meili_client.get_version()
+        version = ctx.meili_client.get_version(ttl=_ttl_seconds(ttlMs))
         return f"Version info: {version}"
 
     @mcp.tool(name="get-stats")
-    def get_stats() -> str:
-        """Get database statistics."""
+    def get_stats(ttlMs: Optional[int] = None) -> str:
+        """
+        Get database statistics.
+
+        Args:
+            ttlMs: Reuse a response fetched less than this many milliseconds ago
+
+        Returns:
+            Database statistics
+        """
         ctx = get_context()
-        stats = ctx.meili_client.get_stats()
+        stats = ctx.meili_client.get_stats(ttl=_ttl_seconds(ttlMs))
         return f"Database stats: {stats}"
 
     @mcp.tool(name="get-health-status")
-    def get_health_status() -> str:
+    async def get_health_status() -> str:
         """Get comprehensive health status of Meilisearch."""
         ctx = get_context()
-        status = ctx.meili_client.monitoring.get_health_status()
+        status = await ctx.meili_client.monitoring.get_health_status()
         ctx.logger.info("Health status checked", status=status.__dict__)
-        return f"Health status: {json.dumps(status.__dict__, default=json_serializer)}"
+        return f"Health status: {dumps(status.__dict__)}"
 
     @mcp.tool(name="get-index-metrics")
-    def get_index_metrics(indexUid: str) -> str:
+    async def get_index_metrics(indexUid: str, ttlMs: Optional[int] = None) -> str:
         """
         Get detailed metrics for an index.
 
         Args:
             indexUid: The unique identifier of the index
+            ttlMs: Reuse index stats fetched less than this many milliseconds ago
 
         Returns:
             JSON string with index metrics
         """
         ctx = get_context()
-        metrics = ctx.meili_client.monitoring.get_index_metrics(indexUid)
+        metrics = await ctx.meili_client.monitoring.get_index_metrics(
+            indexUid, ttl=_ttl_seconds(ttlMs)
+        )
         ctx.logger.info(
             "Index metrics retrieved",
             index=indexUid,
             metrics=metrics.__dict__,
         )
-        return f"Index metrics: {json.dumps(metrics.__dict__, default=json_serializer)}"
+        return f"Index metrics: {dumps(metrics.__dict__)}"
 
     @mcp.tool(name="get-system-info")
-    def get_system_info() -> str:
+    async def get_system_info() -> str:
         """Get system-level information."""
         ctx = get_context()
-        info = ctx.meili_client.monitoring.get_system_information()
+        info = await ctx.meili_client.monitoring.get_system_information()
         ctx.logger.info("System information retrieved", info=info)
         return f"System information: {info}"
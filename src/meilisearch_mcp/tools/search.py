@@ -4,20 +4,18 @@ Search tools for Meilisearch MCP server.
 These tools provide search functionality across Meilisearch indexes.
 """
 
-import json
-from datetime import datetime
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from ..context import get_context
+from ..serialization import dumps_pretty
 
+# Response headers, joined to the payload without an f-string.
+_SEARCH_HEADER = "Search results for '"
+_SEARCH_HEADER_END = "':\n"
+_MULTI_SEARCH_HEADER = "Multi-search results:\n"
 
-def json_serializer(obj: Any) -> str:
-    """Custom JSON serializer for objects not serializable by default json code."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    if hasattr(obj, "__dict__"):
-        return obj.__dict__
-    return str(obj)
+# MeilisearchClient.search keyword names, in the order of the tool parameters.
+_SEARCH_KWARGS = ("query", "index_uid", "limit", "offset", "filter", "sort")
 
 
 def register_search_tools(mcp) -> None:
@@ -48,16 +46,32 @@ def register_search_tools(mcp) -> None:
         """
         ctx = get_context()
 
-        search_results = ctx.meili_client.search(
-            query=query,
-            index_uid=indexUid,
-            limit=limit,
-            offset=offset,
-            filter=filter,
-            sort=sort,
-        )
-
-        formatted_results = json.dumps(
-            search_results, indent=2, default=json_serializer
-        )
-        return f"Search results for '{query}':\n{formatted_results}"
+        # Only forward the arguments that were given; the client applies its
+        # own defaults for the rest.
+        search_kwargs = {
+            name: value
+            for name, value in zip(
+                _SEARCH_KWARGS, (query, indexUid, limit, offset, filter, sort)
+            )
+            if value is not None
+        }
+        search_results = ctx.meili_client.search(**search_kwargs)
+
+        formatted_results = dumps_pretty(search_results)
+        return "".join((_SEARCH_HEADER, query, _SEARCH_HEADER_END, formatted_results))
+
+    @mcp.tool(name="multi-search")
+    def multi_search(queries: List[Dict[str, Any]]) -> str:
+        """
+        Run several searches in a single request, possibly across different indexes.
+
+        Args:
+            queries: List of search queries, each with an indexUid and q, plus
+                optional limit, offset, filter and sort
+
+        Returns:
+            JSON string with one result set per query, in query order
+        """
+        ctx = get_context()
+        response = ctx.meili_client.multi_search(queries)
+        return _MULTI_SEARCH_HEADER + dumps_pretty(response["results"])
@@ -13,7 +13,7 @@ def register_settings_tools(mcp) -> None:
     """Register settings management tools with the FastMCP server."""
 
     @mcp.tool(name="get-settings")
-    def get_settings(indexUid: str) -> str:
+    async def get_settings(indexUid: str) -> str:
         """
         Get current settings for an index.
 
@@ -24,11 +24,11 @@ def register_settings_tools(mcp) -> None:
             Current settings configuration
         """
         ctx = get_context()
-        settings = ctx.meili_client.settings.get_settings(indexUid)
+        settings = await ctx.meili_client.settings.get_settings(indexUid)
         return f"Current settings: {settings}"
 
     @mcp.tool(name="update-settings")
-    def update_settings(indexUid: str, settings: Dict[str, Any]) -> str:
+    async def update_settings(indexUid: str, settings: Dict[str, Any]) -> str:
         """
         Update settings for an index.
 
@@ -40,5 +40,5 @@ def register_settings_tools(mcp) -> None:
             Task information for the settings update
         """
         ctx = get_context()
-        result = ctx.meili_client.settings.update_settings(indexUid, settings)
+        result = await ctx.meili_client.settings.update_settings(indexUid, settings)
         return f"Settings updated: {result}"
@@ -13,7 +13,7 @@ def register_task_tools(mcp) -> None:
     """Register task management tools with the FastMCP server."""
 
     @mcp.tool(name="get-task")
-    def get_task(taskUid: int) -> str:
+    async def get_task(taskUid: int) -> str:
         """
         Get information about a specific task.
 
@@ -24,11 +24,26 @@ def register_task_tools(mcp) -> None:
             Task information
         """
         ctx = get_context()
-        task = ctx.meili_client.tasks.get_task(taskUid)
+        task = await ctx.meili_client.tasks.get_task(taskUid)
         return f"Task information: {task}"
 
+    @mcp.tool(name="get-tasks-batch")
+    async def get_tasks_batch(taskUids: List[int]) -> str:
+        """
+        Get information about several tasks in a single request.
+
+        Args:
+            taskUids: The unique identifiers of the tasks
+
+        Returns:
+            Task information keyed by task UID
+        """
+        ctx = get_context()
+        tasks = await ctx.meili_client.tasks.get_tasks_batch(taskUids)
+        return f"Task information: {tasks}"
+
     @mcp.tool(name="get-tasks")
-    def get_tasks(
+    async def get_tasks(
         limit: Optional[int] = None,
         from_: Optional[int] = None,
         reverse: Optional[bool] = None,
@@ -44,6 +59,7 @@ def register_task_tools(mcp) -> None:
         beforeStartedAt: Optional[str] = None,
         afterFinishedAt: Optional[str] = None,
         beforeFinishedAt: Optional[str] = None,
+        ttlMs: Optional[int] = None,
     ) -> str:
         """
         Get list of tasks with optional filters.
@@ -64,69 +80,42 @@ def register_task_tools(mcp) -> None:
             beforeStartedAt: Filter tasks started before this date
             afterFinishedAt: Filter tasks finished after this date
             beforeFinishedAt: Filter tasks finished before this date
+            ttlMs: Reuse a response for the same filters fetched less than this
+                many milliseconds ago
 
         Returns:
             List of tasks matching the filters
         """
         ctx = get_context()
 
-        # Build parameters dict, only including non-None values
-        valid_params = {
-            "limit",
-            "from",
-            "reverse",
-            "batchUids",
-            "uids",
-            "canceledBy",
-            "types",
-            "statuses",
-            "indexUids",
-            "afterEnqueuedAt",
-            "beforeEnqueuedAt",
-            "afterStartedAt",
-            "beforeStartedAt",
-            "afterFinishedAt",
-            "beforeFinishedAt",
+        # Map parameters, only including non-None values - note: from_ maps to "from"
+        raw_params = {
+            "limit": limit,
+            "from": from_,
+            "reverse": reverse,
+            "batchUids": batchUids,
+            "uids": uids,
+            "canceledBy": canceledBy,
+            "types": types,
+            "statuses": statuses,
+            "indexUids": indexUids,
+            "afterEnqueuedAt": afterEnqueuedAt,
+            "beforeEnqueuedAt": beforeEnqueuedAt,
+            "afterStartedAt": afterStartedAt,
+            "beforeStartedAt": beforeStartedAt,
+            "afterFinishedAt": afterFinishedAt,
+            "beforeFinishedAt": beforeFinishedAt,
         }
+        params = {key: value for key, value in raw_params.items() if value is not None}
 
-        # Map parameters - note: from_ maps to "from"
-        params = {}
-        if limit is not None:
-            params["limit"] = limit
-        if from_ is not None:
-            params["from"] = from_
-        if reverse is not None:
-            params["reverse"] = reverse
-        if batchUids is not None:
-            params["batchUids"] = batchUids
-        if uids is not None:
-            params["uids"] = uids
-        if canceledBy is not None:
-            params["canceledBy"] = canceledBy
-        if types is not None:
-            params["types"] = types
-        if statuses is not None:
-            params["statuses"] = statuses
-        if indexUids is not None:
-            params["indexUids"] = indexUids
-        if afterEnqueuedAt is not None:
-            params["afterEnqueuedAt"] = afterEnqueuedAt
-        if beforeEnqueuedAt is not None:
-            params["beforeEnqueuedAt"] = beforeEnqueuedAt
-        if afterStartedAt is not None:
-            params["afterStartedAt"] = afterStartedAt
-        if beforeStartedAt is not None:
-            params["beforeStartedAt"] = beforeStartedAt
-        if afterFinishedAt is not None:
-            params["afterFinishedAt"] = afterFinishedAt
-        if beforeFinishedAt is not None:
-            params["beforeFinishedAt"] = beforeFinishedAt
-
-        tasks = ctx.meili_client.tasks.get_tasks(params if params else None)
+        ttl = ttlMs / 1000 if ttlMs else 0
+        tasks = await ctx.meili_client.tasks.get_tasks(
+            params if params else None, ttl=ttl
+        )
         return f"Tasks: {tasks}"
 
     @mcp.tool(name="cancel-tasks")
-    def cancel_tasks(
+    async def cancel_tasks(
         uids: Optional[str] = None,
         indexUids: Optional[str] = None,
         types: Optional[str] = None,
@@ -146,15 +135,13 @@ def register_task_tools(mcp) -> None:
         """
         ctx = get_context()
 
-        params = {}
-        if uids is not None:
-            params["uids"] = uids
-        if indexUids is not None:
-            params["indexUids"] = indexUids
-        if types is not None:
-            params["types"] = types
-        if statuses is not None:
-            params["statuses"] = statuses
-
-        result = ctx.meili_client.tasks.cancel_tasks(params)
+        raw_params = {
+            "uids": uids,
+            "indexUids": indexUids,
+            "types": types,
+            "statuses": statuses,
+        }
+        params = {key: value for key, value in raw_params.items() if value is not None}
+
+        result = await ctx.meili_client.tasks.cancel_tasks(params)
         return f"Tasks cancelled: {result}"
@@ -0,0 +1,52 @@
+"""Shared pytest fixtures."""
+
+import os
+
+import pytest
+from src.meilisearch_mcp import context as ctx_mod
+from src.meilisearch_mcp.server import create_server
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests when no Meilisearch instance is configured."""
+    if os.getenv("MEILI_HTTP_ADDR"):
+        return
+    skip = pytest.mark.skip(reason="MEILI_HTTP_ADDR is not set")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def _ctx_snapshot(monkeypatch):
+    """Restore the global server context after each test.
+
+    Tests that need a fresh context call reset_context() themselves.
+    """
+    monkeypatch.setattr(ctx_mod, "_context", ctx_mod._context)
+    yield
+
+
+@pytest.fixture(scope="session")
+def meili_connection():
+    """Meilisearch URL and API key the test session connects to."""
+    return (
+        os.getenv("MEILI_HTTP_ADDR", "http://localhost:7700"),
+        os.getenv("MEILI_MASTER_KEY"),
+    )
+
+
+@pytest.fixture(scope="session")
+async def mcp_server(meili_connection):
+    """Shared MCP server instance, created once per test session."""
+    server = create_server(*meili_connection)
+    yield server
+    # Runs on the session loop, so the async clients created there are awaited
+    await server.acleanup()
+
+
+@pytest.fixture(scope="session")
+async def tool_schemas(mcp_server):
+    """Tool entries from the server's own tools/list result, built once per session."""
+    result = await mcp_server._list_tools()
+    return tuple(result["tools"])
@@ -0,0 +1,62 @@
+"""Tests for the TTL response cache."""
+
+import pytest
+from src.meilisearch_mcp import cache as cache_module
+from src.meilisearch_mcp.cache import TTLCache
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", fake)
+    return fake
+
+
+class TestTTLCache:
+    """Test TTLCache behaviour."""
+
+    def test_miss_when_empty(self):
+        """Test that an unknown key misses."""
+        assert TTLCache().get("/stats", ttl=5) is None
+
+    def test_hit_within_ttl(self, clock):
+        """Test that a fresh entry is returned."""
+        cache = TTLCache()
+        cache.set("/stats", {"databaseSize": 1})
+        clock.now += 4.9
+        assert cache.get("/stats", ttl=5) == {"databaseSize": 1}
+
+    def test_expired_entry_misses(self, clock):
+        """Test that an entry older than the TTL is not returned."""
+        cache = TTLCache()
+        cache.set("/stats", {"databaseSize": 1})
+        clock.now += 5
+        assert cache.get("/stats", ttl=5) is None
+
+    def test_zero_ttl_always_misses(self):
+        """Test that caching is disabled for a non-positive TTL."""
+        cache = TTLCache()
+        cache.set("/version", {"pkgVersion": "1.0"})
+        assert cache.get("/version", ttl=0) is None
+
+    def test_evicts_oldest_entry_when_full(self):
+        """Test that the oldest entry is evicted at capacity."""
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+        cache.set("c", 4)
+        assert len(cache) == 2
+        assert cache.get("b", ttl=60) is None
+        assert cache.get("a", ttl=60) == 3
+        assert cache.get("c", ttl=60) == 4
@@ -7,10 +7,6 @@ from src.meilisearch_mcp.context import ServerContext, get_context, reset_contex
 class TestServerContext:
     """Test ServerContext functionality."""
 
-    def teardown_method(self):
-        """Reset context after each test."""
-        reset_context()
-
     def test_default_initialization(self):
         """Test that ServerContext initializes with defaults."""
         ctx = ServerContext()
@@ -20,20 +16,20 @@ class TestServerContext:
     def test_lazy_client_initialization(self):
         """Test that clients are lazily initialized."""
         ctx = ServerContext()
-        assert ctx._meili_client is None
+        assert "meili_client" not in ctx.__dict__
         # Access property to trigger lazy init
         client = ctx.meili_client
         assert client is not None
-        assert ctx._meili_client is not None
+        assert "meili_client" in ctx.__dict__
 
     def test_lazy_chat_manager_initialization(self):
         """Test that chat manager is lazily initialized."""
         ctx = ServerContext()
-        assert ctx._chat_manager is None
+        assert "chat_manager" not in ctx.__dict__
         # Access property to trigger lazy init
         manager = ctx.chat_manager
         assert manager is not None
-        assert ctx._chat_manager is not None
+        assert "chat_manager" in ctx.__dict__
 
     def test_update_connection(self):
         """Test updating connection settings."""
@@ -44,14 +40,57 @@ class TestServerContext:
         assert ctx.url == new_url
         assert ctx.api_key == new_key
 
+    def test_update_connection_reuses_client_for_same_server(self):
+        """Test that changing only the API key reconfigures the client in place."""
+        ctx = ServerContext(url="http://localhost:7700", api_key="old_key")
+        old_client = ctx.meili_client
+        old_tasks = old_client.tasks
+        old_tasks._cache.set("/tasks", {"results": []})
+        ctx.update_connection(api_key="new_key")
+        assert ctx.meili_client is old_client
+        assert old_client.api_key == "new_key"
+        assert old_client.tasks is old_tasks
+        assert old_tasks.headers["Authorization"] == "Bearer new_key"
+        assert len(old_tasks._cache) == 0
+
+        ctx.update_connection(url="http://otherhost:7700")
+        assert ctx.meili_client is not old_client
+        assert ctx.meili_client.url == "http://otherhost:7700"
+
+    async def test_contexts_for_same_server_share_http_client(self, monkeypatch):
+        """Test that clients for the same URL reuse one pooled HTTP client."""
+        import httpx
+
+        used = []
+
+        async def request(self, method, url, **kwargs):
+            used.append(self)
+            return httpx.Response(
+                200, json={"results": []}, request=httpx.Request(method, url)
+            )
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+        ctx1 = ServerContext(url="http://localhost:7700", api_key="key1")
+        ctx2 = ServerContext(url="HTTP://LOCALHOST:7700/", api_key="key2")
+        await ctx1.meili_client.indexes.list_indexes()
+        await ctx2.meili_client.indexes.list_indexes()
+        assert len(used) == 2
+        assert used[0] is used[1]
+
+    def test_connection_summary_tracks_updates(self):
+        """Test that the cached connection summary follows update_connection."""
+        ctx = ServerContext(url="http://custom:7700", api_key=None)
+        assert "URL: http://custom:7700" in ctx.connection_summary
+        assert "API Key: Not set" in ctx.connection_summary
+        ctx.update_connection(url="http://newhost:7700", api_key="secret")
+        assert "URL: http://newhost:7700" in ctx.connection_summary
+        assert "API Key: ********" in ctx.connection_summary
+        assert "secret" not in ctx.connection_summary
+
 
 class TestContextSingleton:
     """Test global context singleton functionality."""
 
-    def teardown_method(self):
-        """Reset context after each test."""
-        reset_context()
-
     def test_get_context_returns_singleton(self):
         """Test that get_context() returns the same instance."""
         ctx1 = get_context()
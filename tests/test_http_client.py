@@ -1,9 +1,26 @@
 """Tests for HTTP client pool."""
 
+import asyncio
+import gc
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+import httpx
 import pytest
 from src.meilisearch_mcp.http_client import HTTPClientPool, get_http_pool
 
 
+@pytest.fixture(scope="module")
+def pool():
+    return get_http_pool()
+
+
+@pytest.fixture(scope="module")
+def localhost_client(pool):
+    return pool.get_client("http://localhost:7700")
+
+
 class TestHTTPClientPool:
     """Test HTTP client pool functionality."""
 
@@ -12,6 +29,7 @@ class TestHTTPClientPool:
         pool1 = HTTPClientPool()
         pool2 = HTTPClientPool()
         assert pool1 is pool2
+        assert pool1._ssl_context is pool2._ssl_context
 
     def test_get_http_pool_returns_singleton(self):
         """Test that get_http_pool() returns the same instance."""
@@ -19,40 +37,103 @@ class TestHTTPClientPool:
         pool2 = get_http_pool()
         assert pool1 is pool2
 
-    def test_get_client_returns_tuple(self):
+    def test_get_client_returns_tuple(self, localhost_client):
         """Test that get_client() returns (client, headers) tuple."""
-        pool = get_http_pool()
-        result = pool.get_client("http://localhost:7700")
+        result = localhost_client
         assert isinstance(result, tuple)
         assert len(result) == 2
         client, headers = result
         assert client is not None
-        assert isinstance(headers, dict)
+        assert isinstance(headers, Mapping)
 
-    def test_get_client_with_api_key(self):
+    def test_get_client_with_api_key(self, pool):
         """Test that get_client() includes auth header when API key provided."""
-        pool = get_http_pool()
         client, headers = pool.get_client("http://localhost:7700", api_key="test_key")
         assert "Authorization" in headers
         assert headers["Authorization"] == "Bearer test_key"
 
-    def test_get_client_without_api_key(self):
+    def test_get_client_shares_read_only_headers(self, pool):
+        """Test that repeated calls with the same API key share one header mapping."""
+        _, headers1 = pool.get_client("http://localhost:7700", api_key="test_key")
+        _, headers2 = pool.get_client("http://localhost:7700", api_key="test_key")
+        assert headers1 is headers2
+        with pytest.raises(TypeError):
+            headers1["Authorization"] = "Bearer other"
+
+    def test_get_client_without_api_key(self, localhost_client):
         """Test that get_client() excludes auth header when no API key."""
-        pool = get_http_pool()
-        client, headers = pool.get_client("http://localhost:7700")
+        client, headers = localhost_client
         assert "Authorization" not in headers
 
-    def test_get_client_reuses_client(self):
+    def test_get_client_reuses_client(self, pool, localhost_client):
         """Test that get_client() reuses clients for same URL."""
-        pool = get_http_pool()
-        client1, _ = pool.get_client("http://localhost:7700")
+        client1, _ = localhost_client
         client2, _ = pool.get_client("http://localhost:7700")
         # Should return the same client instance
         assert client1 is client2
 
-    def test_get_client_different_headers_same_client(self):
+    def test_get_client_reuses_client_for_equivalent_urls(self, pool):
+        """Test that differently spelled URLs for one server share a client."""
+        client1, _ = pool.get_client("http://localhost:7700")
+        client2, _ = pool.get_client("http://LOCALHOST:7700/")
+        client3, _ = pool.get_client("HTTP://localhost:7700//")
+        assert client1 is client2 is client3
+
+    def test_get_client_keeps_url_path_and_port(self, pool):
+        """Test that path prefixes and non-default ports stay distinct."""
+        client1, _ = pool.get_client("https://example.com:443/meili/")
+        client2, _ = pool.get_client("https://example.com/meili")
+        client3, _ = pool.get_client("https://example.com:8443/meili")
+        assert client1 is client2
+        assert client1 is not client3
+        assert str(client1.base_url) == "https://example.com/meili/"
+
+    def test_get_client_evicts_least_recently_used(self, pool, monkeypatch):
+        """Test that an evicted client is closed once no caller holds it."""
+        monkeypatch.setattr(HTTPClientPool, "_clients", OrderedDict())
+        monkeypatch.setattr(HTTPClientPool, "_async_clients", OrderedDict())
+        monkeypatch.setattr(HTTPClientPool, "_max_clients", 2)
+        closed = []
+        close = httpx.HTTPTransport.close
+
+        def record_close(self):
+            closed.append(self)
+            close(self)
+
+        monkeypatch.setattr(httpx.HTTPTransport, "close", record_close)
+        first, _ = pool.get_client("http://host-a:7700")
+        second, _ = pool.get_client("http://host-b:7700")
+        # Touch the first client so the second becomes least recently used
+        pool.get_client("http://host-a:7700")
+        pool.get_client("http://host-c:7700")
+
+        assert second not in HTTPClientPool._clients.values()
+        assert pool.get_client("http://host-a:7700")[0] is first
+        assert len(HTTPClientPool._clients) == 2
+        # Still open while a caller may be mid-request on it
+        assert not second.is_closed
+        transport = second._transport
+        del second
+        gc.collect()
+        assert closed == [transport]
+        pool.close_all()
+
+    def test_get_client_keeps_connections_alive(self, localhost_client):
+        """Test that pooled clients are configured to keep connections alive."""
+        client, _ = localhost_client
+        assert client._transport._pool._max_keepalive_connections > 0
+        assert client._transport._pool._keepalive_expiry > 0
+
+    def test_clients_share_ssl_context(self, pool):
+        """Test that clients for different URLs reuse one SSL context."""
+        client1, _ = pool.get_client("https://localhost:7700")
+        client2, _ = pool.get_client("https://localhost:7701")
+        assert client1 is not client2
+        assert client1._transport._pool._ssl_context is pool._ssl_context
+        assert client2._transport._pool._ssl_context is pool._ssl_context
+
+    def test_get_client_different_headers_same_client(self, pool):
         """Test that different API keys use the same client but different headers."""
-        pool = get_http_pool()
         client1, headers1 = pool.get_client("http://localhost:7700", api_key="key1")
         client2, headers2 = pool.get_client("http://localhost:7700", api_key="key2")
         # Should reuse the same client
@@ -61,3 +142,74 @@ class TestHTTPClientPool:
         assert headers1 != headers2
         assert headers1["Authorization"] == "Bearer key1"
         assert headers2["Authorization"] == "Bearer key2"
+
+    async def test_get_async_client_reuses_client_within_loop(self, pool):
+        """Test that get_async_client() reuses the client on the same event loop."""
+        client1, headers = pool.get_async_client(
+            "http://localhost:7700", api_key="test_key"
+        )
+        client2, _ = pool.get_async_client("http://localhost:7700")
+        assert client1 is client2
+        assert headers["Authorization"] == "Bearer test_key"
+
+    async def test_async_client_from_other_loop_is_closed_on_replace(self, pool):
+        """Test that replacing a client bound to another loop closes it there."""
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+        try:
+
+            async def create():
+                return pool.get_async_client("http://other-loop:7700")[0]
+
+            old = asyncio.run_coroutine_threadsafe(create(), other_loop).result()
+            new, _ = pool.get_async_client("http://other-loop:7700")
+            assert new is not old
+            # Let the other loop run the aclose() scheduled on it
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other_loop).result()
+            assert old.is_closed
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+
+    async def test_async_clients_are_bounded(self, pool, monkeypatch):
+        """Test that an evicted async client is closed once no caller holds it."""
+        monkeypatch.setattr(HTTPClientPool, "_async_clients", OrderedDict())
+        monkeypatch.setattr(HTTPClientPool, "_max_clients", 2)
+        closed = []
+        aclose = httpx.AsyncHTTPTransport.aclose
+
+        async def record_aclose(self):
+            closed.append(self)
+            await aclose(self)
+
+        monkeypatch.setattr(httpx.AsyncHTTPTransport, "aclose", record_aclose)
+        first, _ = pool.get_async_client("http://evict-a:7700")
+        pool.get_async_client("http://evict-b:7700")
+        pool.get_async_client("http://evict-c:7700")
+        assert len(pool._async_clients) == 2
+        # Still open while a caller may be mid-request on it
+        await asyncio.sleep(0)
+        assert not first.is_closed
+        transport = first._transport
+        del first
+        gc.collect()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert closed == [transport]
+        for _, client in pool._async_clients.values():
+            await client.aclose()
+
+    async def test_prewarm_ignores_unreachable_server(self, pool):
+        """Test that prewarm() does not raise when the server cannot be reached."""
+        await pool.prewarm("http://127.0.0.1:1", timeout=1.0)
+
+    async def test_prewarm_ignores_os_errors(self, pool, monkeypatch):
+        """Test that prewarm() also swallows socket errors outside httpx."""
+
+        async def fail(*args, **kwargs):
+            raise OSError("network unreachable")
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", fail)
+        await pool.prewarm("http://127.0.0.1:1", timeout=1.0)
@@ -0,0 +1,45 @@
+"""Tests for the shared JSON serializer."""
+
+from decimal import Decimal
+
+import orjson
+from src.meilisearch_mcp.serialization import dumps, dumps_pretty
+
+
+class Record:
+    def __init__(self):
+        self.uid = "movies"
+
+
+class SlottedRecord:
+    __slots__ = ("uid",)
+
+    def __init__(self):
+        self.uid = "movies"
+
+    def __str__(self):
+        return f"SlottedRecord({self.uid})"
+
+
+class TestSerialization:
+    """Test fallback conversion of non-JSON types."""
+
+    def test_object_serializes_its_attributes(self):
+        """Test that plain objects are serialized from their __dict__."""
+        assert orjson.loads(dumps(Record())) == {"uid": "movies"}
+
+    def test_slotted_object_serializes_as_string(self):
+        """Test that objects without a __dict__ fall back to str()."""
+        assert orjson.loads(dumps([SlottedRecord(), SlottedRecord()])) == [
+            "SlottedRecord(movies)",
+            "SlottedRecord(movies)",
+        ]
+
+    def test_set_and_decimal(self):
+        """Test that sets become lists and decimals become strings."""
+        result = orjson.loads(dumps({"ids": {1}, "price": Decimal("9.90")}))
+        assert result == {"ids": [1], "price": "9.90"}
+
+    def test_pretty_output_is_indented(self):
+        """Test that dumps_pretty indents by two spaces."""
+        assert dumps_pretty({"a": 1}) == '{\n  "a": 1\n}'
@@ -7,3 +7,21 @@ def test_server_creation():
     server = create_server()
     assert server is not None
     assert server.meili_client is not None
+
+
+def test_verify_token(monkeypatch):
+    """Test bearer and X-MCP-Token authentication against the configured token"""
+    from aiohttp.test_utils import make_mocked_request
+    from src.meilisearch_mcp.config import config
+
+    monkeypatch.setattr(config, "MCP_AUTH_TOKEN", "secret-token")
+    server = create_server()
+
+    def request(headers):
+        return make_mocked_request("POST", "/mcp", headers=headers)
+
+    assert server._verify_token(request({"Authorization": "Bearer secret-token"}))
+    assert server._verify_token(request({"X-MCP-Token": "secret-token"}))
+    assert not server._verify_token(request({"Authorization": "Bearer wrong"}))
+    assert not server._verify_token(request({"X-MCP-Token": "wrong"}))
+    assert not server._verify_token(request({}))
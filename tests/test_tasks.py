@@ -0,0 +1,30 @@
+"""Tests for TaskManager error handling."""
+
+import httpx
+import pytest
+from src.meilisearch_mcp.exceptions import MeilisearchTaskError
+from src.meilisearch_mcp.tasks import TaskManager
+
+
+class TestTaskErrors:
+    """Test that task API failures surface as MeilisearchTaskError."""
+
+    async def test_http_error_raises_task_error(self, monkeypatch):
+        """Test that status code and truncated body are kept on the error."""
+        manager = TaskManager("http://localhost:7700")
+        request = httpx.Request("GET", "http://localhost:7700/tasks/1")
+        response = httpx.Response(404, text="x" * 500, request=request)
+
+        async def fake_request(method, endpoint, params=None):
+            raise httpx.HTTPStatusError("not found", request=request, response=response)
+
+        monkeypatch.setattr(manager, "_make_request", fake_request)
+
+        with pytest.raises(MeilisearchTaskError) as exc_info:
+            await manager.get_task(1)
+
+        error = exc_info.value
+        assert error.status_code == 404
+        assert error.response_text == "x" * 200
+        assert str(error).startswith("Failed to get task (HTTP 404)")
+        assert isinstance(error.__cause__, httpx.HTTPStatusError)